@@ -0,0 +1,18 @@
+from dotenv import load_dotenv
+from functools import lru_cache
+import os
+
+@lru_cache(maxsize=1)
+def get_credentials():
+    """
+    Returns the Copernicus Data Space credentials.
+
+    The `.env` file is loaded on the first call only, later calls in the
+    same process return the cached values.
+
+    Returns:
+        tuple[str, str]: The username and password, read from the
+        `COPERNICUS_USERNAME` and `COPERNICUS_PASSWORD` environment variables.
+    """
+    load_dotenv()
+    return os.getenv("COPERNICUS_USERNAME"), os.getenv("COPERNICUS_PASSWORD")
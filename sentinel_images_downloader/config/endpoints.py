@@ -1,3 +1,8 @@
 LOGIN_URL = "https://identity.dataspace.copernicus.eu/auth/realms/CDSE/protocol/openid-connect/token"
 DATA_URL = "https://catalogue.dataspace.copernicus.eu/odata/v1"
-DOWNLOAD_URL = "https://download.dataspace.copernicus.eu/odata/v1"
\ No newline at end of file
+DOWNLOAD_URL = "https://download.dataspace.copernicus.eu/odata/v1"
+
+# Redirects within this domain keep the Bearer token
+AUTH_DOMAIN = "dataspace.copernicus.eu"
+
+USER_AGENT = "sentinel-images-downloader/1.0"
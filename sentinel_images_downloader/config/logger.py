@@ -1,17 +1,37 @@
 from sentinel_images_downloader.config.path import LOGS_DIR
+from logging.handlers import QueueHandler, QueueListener
 import pathlib
 import logging
+import atexit
+import queue
 
-def setup_logger(file_name: str | pathlib.Path) -> logging.Logger:
-    logger = logging.getLogger()
-    logger.setLevel(level=logging.INFO)
+PACKAGE_LOGGER_NAME = "sentinel_images_downloader"
+
+def setup_logger(file_name: str | pathlib.Path, level: int | str = logging.INFO) -> logging.Logger:
+    """
+    Configures the package logger to write to a log file and to the console.
+
+    Handlers are attached to the `sentinel_images_downloader` logger rather than
+    the root logger, so the logging of other libraries is left untouched. Records
+    are handed to a `QueueListener` thread through a `QueueHandler`, so download
+    workers never block on file or console writes. Calling it again returns the
+    already configured logger.
+
+    Args:
+        file_name (str | pathlib.Path): Name of the log file, inside `LOGS_DIR`.
+        level (int | str, optional): Logging level. Default is `logging.INFO`.
+
+    Returns:
+        logging.Logger: The package logger.
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+    logger.setLevel(level=level)
+    if logger.handlers:
+        return logger
     logger.propagate = False
 
     file_name = pathlib.Path(file_name)
 
-    if logger.hasHandlers():
-        logger.handlers.clear()
-
     formatter = logging.Formatter(
         fmt="%(asctime)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -23,10 +43,14 @@ def setup_logger(file_name: str | pathlib.Path) -> logging.Logger:
         mode="w", 
     )
     file_handler.setFormatter(fmt=formatter)
-    logger.addHandler(hdlr=file_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(fmt=formatter)
-    logger.addHandler(hdlr=console_handler)
 
-    return logger
\ No newline at end of file
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(hdlr=QueueHandler(log_queue))
+
+    return logger
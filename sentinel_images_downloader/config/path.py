@@ -4,13 +4,20 @@ import pathlib
 PROJECT_DIR = pathlib.Path(__file__).resolve().parents[2]
 
 LOGS_DIR = PROJECT_DIR / "logs"
+CATALOG_CACHE_DIR = LOGS_DIR / "catalog_cache"
+
+# Kept outside the project, it holds a refresh token
+TOKEN_CACHE_PATH = pathlib.Path.home() / ".cache" / "cdse" / "token.json"
 
 directories_to_create = [
     LOGS_DIR,
+    CATALOG_CACHE_DIR,
 ]
 
 def ensure_dirs_exist(paths: list[pathlib.Path]) -> None:
     for path in paths:
         path.mkdir(parents=True, exist_ok=True)
 
-ensure_dirs_exist(paths=directories_to_create)
\ No newline at end of file
+def init_paths() -> None:
+    """Creates the log and cache directories, if they do not exist yet."""
+    ensure_dirs_exist(paths=directories_to_create)
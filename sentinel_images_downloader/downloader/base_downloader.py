@@ -1,19 +1,89 @@
-from sentinel_images_downloader.config.endpoints import DATA_URL, DOWNLOAD_URL
-from sentinel_images_downloader.utils.io_utils import download_file, process_path
-from sentinel_images_downloader.utils.auth import get_keycloak
+from sentinel_images_downloader.config.endpoints import DATA_URL, DOWNLOAD_URL, USER_AGENT
+from sentinel_images_downloader.config.path import CATALOG_CACHE_DIR, TOKEN_CACHE_PATH, init_paths
+from sentinel_images_downloader.utils.io_utils import (
+    download_file, download_file_range, loads_json, preallocate, process_path, write_file_atomic
+)
+from sentinel_images_downloader.utils.auth import AuthSession, BearerAuth, TokenProvider
+from sentinel_images_downloader.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 from sentinel_images_downloader.utils.dates import process_dates
-from sentinel_images_downloader.utils.xml_utils import parse_manifest, get_files
+from sentinel_images_downloader.utils.ratelimit import RateLimiter, get_backoff_delay, get_retry_delay
+from sentinel_images_downloader.utils.xml_utils import get_manifest_entries
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 import requests
+import threading
+import hashlib
+import os
+import re
 import time 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are fetched as several parallel HTTP Range requests
+RANGED_DOWNLOAD_THRESHOLD = 64 << 20
+RANGED_DOWNLOAD_PARTS = 4
+
+# Content-Range header of a partial (HTTP 206) response, e.g. "bytes 0-1023/4096"
+CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(?:\d+|\*)")
+
+# (connect, read) timeouts of the streamed manifest and file downloads
+DOWNLOAD_TIMEOUT = (10, 300)
+
+# (connect, read) timeouts of the catalogue queries
+CATALOG_TIMEOUT = (10, 60)
+
+# Products per catalogue page (the server maximum), further pages follow @odata.nextLink
+CATALOG_PAGE_SIZE = 1000
+
+# Seconds during which a cached catalogue page is reused instead of queried again
+CATALOG_CACHE_TTL = 3600
+
+# Number of monthly date ranges combined into a single catalogue query
+DATE_RANGES_PER_QUERY = 12
+
+# HTTP errors that retrying cannot fix
+UNRECOVERABLE_STATUS_CODES = {400, 401, 403, 404}
+
+# Consecutive product failures after which the rest of a (tile, date range) job is skipped
+CIRCUIT_BREAKER_THRESHOLD = 5
+
+# Seconds the next jobs wait after the circuit breaker tripped, before a single trial product
+CIRCUIT_BREAKER_COOLDOWN = 60
+
+def _nodes_path(file):
+    """
+    Converts a path relative to the product root into its OData `Nodes` path.
+
+    Example:
+        >>> _nodes_path("GRANULE/L2A_T19HCC/IMG_DATA/B02.jp2")
+        'Nodes(GRANULE)/Nodes(L2A_T19HCC)/Nodes(IMG_DATA)/Nodes(B02.jp2)'
+    """
+    return "Nodes(" + file.replace("/", ")/Nodes(") + ")"
+
+def _retry_policy():
+    """
+    Returns the retry policy of the HTTP adapters, for unavailable (5xx) responses.
+
+    Throttled (429) responses are not retried here but by `SentinelDownloader._get`,
+    and `Retry-After` is ignored so that only its capped delay applies.
+    """
+    return Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=False,
+    )
+
 class SentinelDownloader(ABC):
-    def __init__(self, username, password, initial_date, last_date, output_dir, max_retries):
+    def __init__(self, username, password, initial_date, last_date, output_dir, max_retries,
+        max_parallel_files=8, max_parallel_ranges=4, max_parallel_products=2, max_concurrent_downloads=4,
+        requests_per_second=4, requests_per_hour=None,
+        deep_validate=False):
         """
         Args:
             username (str): Copernicus API username.
@@ -22,6 +92,17 @@ class SentinelDownloader(ABC):
             last_date (str): End date to download, in format YYYY-MM-DD.
             output_dir (str): Path to save the files.
             max_retries (int): Number of retries if corrupt file.
+            max_parallel_files (int): Number of files of a product downloaded concurrently.
+            max_parallel_ranges (int): Number of (tile, date range) pairs processed concurrently.
+            max_parallel_products (int): Number of products of a (tile, date range) pair
+                downloaded concurrently.
+            max_concurrent_downloads (int): Number of file (or byte range) transfers in
+                flight at once across all workers, to stay under the per-user
+                connection limit of the download service.
+            requests_per_second (float): Maximum rate of requests sent to the API.
+            requests_per_hour (float, optional): Maximum number of requests per hour, if any.
+            deep_validate (bool): Whether downloaded rasters are opened with rasterio
+                on top of the header checks.
         """
         self.username = username
         self.password = password
@@ -36,6 +117,21 @@ class SentinelDownloader(ABC):
         self.output_dir = Path(output_dir)
 
         self.max_retries = max_retries
+        self.max_parallel_files = max_parallel_files
+        self.max_parallel_ranges = max_parallel_ranges
+        self.max_parallel_products = max_parallel_products
+        self.max_concurrent_downloads = max_concurrent_downloads
+        self.deep_validate = deep_validate
+
+        init_paths()
+        self._token_provider = TokenProvider(username, password, cache_path=TOKEN_CACHE_PATH)
+        self._limiter = RateLimiter(requests_per_second, requests_per_hour)
+        self._rate_limited_until = 0.0
+        self._rate_limited_lock = threading.Lock()
+        self._download_slots = threading.BoundedSemaphore(max_concurrent_downloads)
+        self._progress = None
+        self._breaker = CircuitBreaker(threshold=CIRCUIT_BREAKER_THRESHOLD, cooldown=CIRCUIT_BREAKER_COOLDOWN)
+        self._catalog_session = self.init_catalog_session()
 
     def init_session(self):
         """
@@ -43,17 +139,139 @@ class SentinelDownloader(ABC):
 
         This method:
         - Retrieves an access token using Keycloak authentication.
-        - Creates a new `requests.Session` instance.
-        - Updates the session headers to include the Bearer token for authorization.
+        - Creates a new `AuthSession`, which keeps the token on redirects to other
+          Copernicus hosts.
+        - Sets a `BearerAuth` handler that adds the current token to every request,
+          renewing it through the shared `TokenProvider` when it is about to expire.
+        - Mounts an `HTTPAdapter` whose connection pool is large enough for the parallel
+          file downloads and which retries unavailable (5xx) responses. Throttled (429)
+          responses are left to `self._get`, which paces every worker on them, and
+          `Retry-After` is ignored here so that the capped delay of `get_retry_delay`
+          is the only one applied.
 
         Returns:
             requests.Session: A configured session with authentication headers.
         """
-        access_token = get_keycloak(self.username, self.password)
+        self._token_provider.get()
+        session = AuthSession()
+        session.headers["User-Agent"] = USER_AGENT
+        session.auth = BearerAuth(self._token_provider)
+
+        pool_size = max(32, self.max_parallel_files * self.max_parallel_products)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=_retry_policy())
+        session.mount("https://", adapter)
+        return session
+
+    def init_catalog_session(self):
+        """
+        Initializes the session used to query the product catalogue.
+
+        Catalogue queries do not need authentication, but sending them through a
+        long-lived session keeps the connection to the catalogue host alive across
+        date ranges instead of opening a new one per query. Like the download session,
+        it retries unavailable (5xx) responses, so a transient catalogue error does not
+        fail a whole (tile, date range) job.
+
+        Returns:
+            requests.Session: A session with a pooled adapter mounted for the catalogue URL.
+        """
         session = requests.Session()
-        session.headers.update({"Authorization": f"Bearer {access_token}"})
+        session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=_retry_policy())
+        session.mount(self.data_url, adapter)
         return session
 
+    def _get(self, session, url, **kwargs):
+        """
+        Sends a GET request once the rate limiter allows it.
+
+        After an HTTP 429 response, and for as long as the server asked to wait,
+        requests are sent one at a time through `self._rate_limited_lock`, so
+        the parallel workers probe the server one by one instead of all retrying
+        at once. Outside of these windows requests are sent concurrently.
+
+        Throttled responses are returned as is: file downloads retry them in
+        `fetch_file`, after releasing their download slot, and the other requests
+        go through `_get_retrying`.
+
+        Args:
+            session (requests.Session): The session used to send the request.
+            url (str): The requested URL.
+            **kwargs: Extra arguments forwarded to `session.get`.
+
+        Returns:
+            requests.Response: The server response.
+        """
+        self._limiter.acquire()
+        if time.monotonic() < self._rate_limited_until:
+            with self._rate_limited_lock:
+                response = session.get(url, **kwargs)
+        else:
+            response = session.get(url, **kwargs)
+
+        if response.status_code == 429:
+            window = get_retry_delay(response, attempt=1)
+            with self._rate_limited_lock:
+                self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + window)
+            logger.warning("Rate limited by the server. Serializing requests for %.1f s...", window)
+        return response
+
+    def _get_retrying(self, session, url, **kwargs):
+        """
+        Sends a GET request with `_get`, retrying throttled (429) responses.
+
+        Used for the requests that hold no download slot (catalogue pages and
+        manifests). Each retry waits for the capped delay of `get_retry_delay`,
+        and the request is sent at most `self.max_retries` times.
+
+        Args:
+            session (requests.Session): The session used to send the request.
+            url (str): The requested URL.
+            **kwargs: Extra arguments forwarded to `session.get`.
+
+        Returns:
+            requests.Response: The server response, still HTTP 429 if every attempt was throttled.
+        """
+        attempts = max(1, self.max_retries)
+        for attempt in range(1, attempts + 1):
+            response = self._get(session, url, **kwargs)
+            if response.status_code != 429 or attempt == attempts:
+                return response
+            response.close()
+            delay = get_retry_delay(response, attempt)
+            logger.info("Rate limited by the server. Retrying %s in %.1f s...", url, delay)
+            time.sleep(delay)
+
+    def get_catalog_page(self, query):
+        """
+        Returns one page of catalogue results, from the disk cache when possible.
+
+        Pages are cached in `CATALOG_CACHE_DIR` under the SHA-1 of their query,
+        so re-running the same date ranges within `CATALOG_CACHE_TTL` seconds
+        does not query the catalogue again. Cache files are written atomically.
+        Pages are decoded with `orjson` when it is installed.
+
+        Args:
+            query (str): The OData query (or `@odata.nextLink`) of the page.
+
+        Returns:
+            dict: The decoded JSON page.
+        """
+        cache_path = CATALOG_CACHE_DIR / f"{hashlib.sha1(query.encode()).hexdigest()}.json"
+        try:
+            if time.time() - cache_path.stat().st_mtime < CATALOG_CACHE_TTL:
+                return loads_json(cache_path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            logger.warning("Ignoring unreadable catalogue cache %s: %s", cache_path, e)
+
+        response = self._get_retrying(self._catalog_session, query, timeout=CATALOG_TIMEOUT)
+        response.raise_for_status()
+        data = loads_json(response.content)
+        write_file_atomic(cache_path, response.content)
+        return data
+
     def prepare_output(self, product_name):
         """
         Creates and returns the output directory for a given product.
@@ -68,11 +286,54 @@ class SentinelDownloader(ABC):
         """
         product_path = self.output_dir / product_name
         product_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created output directory for the files: {product_path}")
+        logger.info("Created output directory for the files: %s", product_path)
         return product_path
 
+    def get_selection(self):
+        """
+        Returns the criteria used by `filter_images` to select the files of a product.
+
+        Subclasses that filter files should override it, so that products downloaded
+        with a different selection are not considered complete.
+
+        Returns:
+            list[str]: The selection criteria (empty when every file is downloaded).
+        """
+        return []
+
+    def selection_digest(self):
+        """
+        Returns a SHA-1 digest of the sorted selection criteria.
+
+        Returns:
+            str: Hexadecimal digest stored in the `.complete` marker of each product.
+        """
+        selection = "\n".join(sorted(self.get_selection()))
+        return hashlib.sha1(selection.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _combined_date_predicate(date_ranges):
+        """
+        Combines several date ranges into a single OData predicate.
+
+        Args:
+            date_ranges (list of tuples): (start, end) pairs in ISO 8601 format.
+
+        Returns:
+            str: The date ranges joined by `or`.
+
+        Example:
+            >>> SentinelDownloader._combined_date_predicate([("A", "B"), ("C", "D")])
+            '((ContentDate/Start ge A and ContentDate/End le B) or (ContentDate/Start ge C and ContentDate/End le D))'
+        """
+        predicates = " or ".join(
+            f"(ContentDate/Start ge {initial_date} and ContentDate/End le {last_date})"
+            for initial_date, last_date in date_ranges
+        )
+        return f"({predicates})"
+
     @abstractmethod
-    def get_query(self, tile_id, initial_date, last_date):
+    def get_query(self, tile_id, date_ranges):
         """Abstract method to be implemented by subclasses."""
         pass
 
@@ -86,11 +347,14 @@ class SentinelDownloader(ABC):
         Downloads a Sentinel product and its relevant files.
 
         This method:
-        1. Creates an output directory for the product.
-        2. Downloads the `manifest.safe` file if it does not already exist.
-        3. Parses the manifest file to retrieve the list of image files.
-        4. Filters image files based on predefined criteria.
-        5. Downloads the filtered image files if they do not already exist.
+        1. Returns immediately if the product was already downloaded with the same selection,
+           or if every selected file of the cached manifest is already on disk.
+        2. Creates an output directory for the product.
+        3. Downloads the `manifest.safe` file if it does not already exist or has changed.
+        4. Parses the manifest file to retrieve the list of image files.
+        5. Filters image files based on predefined criteria.
+        6. Downloads the filtered image files concurrently if they do not already exist.
+        7. Writes a `.complete` marker with the selection digest.
 
         Args:
             session (requests.Session): An authenticated session for making HTTP requests.
@@ -100,85 +364,522 @@ class SentinelDownloader(ABC):
 
         Notes:
             - The function ensures that files are downloaded only if they are missing.
+            - Up to `self.max_parallel_files` files are fetched at once over the shared session.
+              A failing file does not abort the others; the first error is raised once
+              every file of the product has been attempted.
             - The folder structure is preserved to match the Sentinel-2 SAFE format.
         """
         product_id = SAFE_product["Id"]
         product_name = SAFE_product["Name"]
         product_base_url = f"{self.download_url}/Products({product_id})/Nodes({product_name})"
 
+        selection_digest = self.selection_digest()
+        complete_path = self.output_dir / product_name / ".complete"
+        if complete_path.is_file() and complete_path.read_text() == selection_digest:
+            logger.info("%s already downloaded. Skipping...", product_name)
+            return
+
         product_path = self.prepare_output(product_name)
 
         manifest_path = product_path / "manifest.safe"
-        if not manifest_path.is_file():
-            manifest_url = f"{product_base_url}/Nodes(manifest.safe)/$value"
-            response = session.get(manifest_url, allow_redirects=False)
+        if manifest_path.is_file() and self.has_local_files(product_path, manifest_path):
+            logger.info("%s already downloaded. Skipping...", product_name)
+            complete_path.write_text(selection_digest)
+            return
+        self.fetch_manifest(session, product_base_url, manifest_path)
+
+        entries = {entry["href"]: entry for entry in get_manifest_entries(manifest_path)}
+        files_list = self.filter_images(list(entries))
+        logger.info("Found %s files to download", len(files_list))
+        self._add_to_progress_total(len(files_list))
+
+        for directory in {process_path(product_path / file).parent for file in files_list}:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        failures = []
+        with ThreadPoolExecutor(max_workers=self.max_parallel_files) as executor:
+            futures = {
+                executor.submit(
+                    self.fetch_file, session, product_base_url, product_path, file,
+                    entries[file]["size"], entries[file]["md5"],
+                ): file
+                for file in files_list
+            }
+            for future in as_completed(futures):
+                self._update_progress()
+                if future.exception() is not None:
+                    failures.append((futures[future], future.exception()))
+
+        if failures:
+            failed_files = [file for file, _ in failures]
+            logger.error("%s files of %s failed to download: %s", len(failures), product_name, failed_files)
+            raise failures[0][1]
+
+        complete_path.write_text(selection_digest)
+
+    def has_local_files(self, product_path, manifest_path):
+        """
+        Checks whether every selected file of a cached manifest is already on disk.
+
+        This covers products downloaded by a run that stopped before writing their
+        `.complete` marker, which can then be skipped without any request.
+
+        Args:
+            product_path (pathlib.Path): Output directory of the product.
+            manifest_path (pathlib.Path): Path of the cached manifest.
+
+        Returns:
+            bool: True if every selected file exists with the size listed in the manifest.
+        """
+        entries = {entry["href"]: entry for entry in get_manifest_entries(manifest_path)}
+        for file in self.filter_images(list(entries)):
+            file_path = process_path(product_path / file)
+            try:
+                size = file_path.stat().st_size
+            except FileNotFoundError:
+                return False
+            if entries[file]["size"] is not None and size != entries[file]["size"]:
+                return False
+        return True
+
+    def fetch_manifest(self, session, product_base_url, manifest_path):
+        """
+        Downloads the `manifest.safe` file of a product, revalidating a cached copy.
+
+        The `ETag` of the response is stored next to the manifest in a `.etag` file.
+        When both exist, the manifest is requested with `If-None-Match` and the server
+        answers `304 Not Modified` without a body if the cached copy is still valid.
+        A cached manifest without `.etag` is used as is.
+
+        Args:
+            session (requests.Session): An authenticated session for making HTTP requests.
+            product_base_url (str): Base URL of the product nodes.
+            manifest_path (pathlib.Path): Path where the manifest is saved.
+        """
+        etag_path = manifest_path.with_name(f"{manifest_path.name}.etag")
+        headers = {}
+        if manifest_path.is_file():
+            if not etag_path.is_file():
+                return
+            headers["If-None-Match"] = etag_path.read_text()
+
+        manifest_url = f"{product_base_url}/Nodes(manifest.safe)/$value"
+        with self._get_retrying(
+            session, manifest_url, headers=headers, allow_redirects=True, stream=True, timeout=DOWNLOAD_TIMEOUT
+        ) as response:
+            if response.status_code == 304:
+                logger.info("%s not modified. Using the cached copy...", manifest_path)
+                return
+            response.raise_for_status()
+
+            etag = response.headers.get("ETag")
             download_file(response, manifest_path)
+        if etag:
+            etag_path.write_text(etag)
+        else:
+            etag_path.unlink(missing_ok=True)
 
-        xmldict = parse_manifest(manifest_path)
-        files_list = self.filter_images(get_files(xmldict))
-        logger.info(f"Found {len(files_list)} files to download")
-
-        for file in files_list:
-            file_path = product_path / file
-            file_path = process_path(file_path)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            if file_path.is_file():
-                logger.info(f"{file_path} already exists. Skipping...")
-                continue
-
-            nodes_str = "/".join([f"Nodes({node})" for node in file.split("/")])
-            file_url = f"{product_base_url}/{nodes_str}/$value"
-
-            for attempt in range(1, self.max_retries+1):
-                try:
-                    response = session.get(file_url, allow_redirects=False)
-                    download_file(response, file_path)
-                    self.validate_download(file_path)
-                    break
-                
-                except Exception as e:
-                    logger.warning(f"Attempt {attempt} failed for {file_path}: {e}")
-                    file_path.unlink(missing_ok=True)
+    def _add_to_progress_total(self, count):
+        """
+        Adds files to the total of the run progress bar, if there is one.
+
+        Args:
+            count (int): Number of files to add.
+        """
+        if self._progress is None:
+            return
+        with self._progress.get_lock():
+            self._progress.total += count
+            self._progress.refresh()
+
+    def _update_progress(self):
+        """Marks one file as processed in the run progress bar, if there is one."""
+        if self._progress is None:
+            return
+        with self._progress.get_lock():
+            self._progress.update(1)
+
+    def fetch_file(self, session, product_base_url, product_path, file, expected_size=None, expected_md5=None):
+        """
+        Downloads a single file of a product, retrying if it is corrupt.
+
+        Args:
+            session (requests.Session): An authenticated session for making HTTP requests.
+            product_base_url (str): Base URL of the product nodes.
+            product_path (pathlib.Path): Output directory of the product.
+            file (str): Path of the file relative to the product root.
+                Its parent directory must already exist.
+            expected_size (int, optional): Size of the file in bytes, as listed in the manifest.
+                An existing file is only skipped if it has this size, and a downloaded
+                file of another size is treated as corrupt.
+            expected_md5 (str, optional): MD5 checksum of the file, as listed in the manifest.
+                A downloaded file with another checksum is treated as corrupt.
+
+        Raises:
+            Exception: If the file could not be downloaded after `self.max_retries` attempts,
+                or right away on an unrecoverable HTTP error (400, 401, 403, 404).
+
+        Notes:
+            - Retries wait for an exponential backoff with full jitter, or for the
+              capped `Retry-After` delay of throttled (429) responses. The wait happens
+              once the download slot is released, and this loop is the only one retrying
+              throttled file requests.
+            - Each transfer holds one of the `self.max_concurrent_downloads` download
+              slots; a ranged download takes one slot per range instead.
+        """
+        file_path = product_path / file
+        file_path = process_path(file_path)
+        if file_path.is_file():
+            if expected_size is None or file_path.stat().st_size == expected_size:
+                logger.info("%s already exists. Skipping...", file_path)
+                return
+            logger.warning("%s does not have the expected size. Downloading it again...", file_path)
+
+        file_url = f"{product_base_url}/{_nodes_path(file)}/$value"
+
+        for attempt in range(1, self.max_retries+1):
+            try:
+                md5 = received = None
+                with self._download_slots, self._get(
+                    session, file_url, allow_redirects=True, stream=True, timeout=DOWNLOAD_TIMEOUT
+                ) as response:
+                    response.raise_for_status()
+                    self.check_content_length(response, file_path, expected_size)
+                    size = int(response.headers.get("Content-Length", 0))
+                    ranged = size >= RANGED_DOWNLOAD_THRESHOLD and response.headers.get("Accept-Ranges") == "bytes"
+                    if not ranged:
+                        md5 = download_file(response, file_path, size=size)
+                if ranged:
+                    received = self._ranged_download(session, file_url, file_path, size, expected_md5)
+                self.check_size(file_path, expected_size, received)
+                self.check_md5(file_path, md5, expected_md5)
+                self.validate_download(file_path)
+                break
+            
+            except Exception as e:
+                logger.warning("Attempt %s failed for %s: %s", attempt, file_path, e)
+                file_path.unlink(missing_ok=True)
+
+                status_code = e.response.status_code if isinstance(e, requests.exceptions.HTTPError) else None
+                if status_code in UNRECOVERABLE_STATUS_CODES:
+                    logger.error("Unrecoverable HTTP %s for %s. Giving up.", status_code, file_path)
+                    raise
+                if attempt == self.max_retries:
+                    logger.error("Max retries reached for %s. Giving up.", file_path)
+                    raise
+
+                if status_code == 429:
+                    delay = get_retry_delay(e.response, attempt)
+                    logger.info("Rate limited by the server. Waiting %.1f s...", delay)
+                else:
+                    delay = get_backoff_delay(attempt)
+                logger.info("Retrying download for %s in %.1f s...", file_path, delay)
+                time.sleep(delay)
+
+    @staticmethod
+    def check_size(file_path, expected_size, size=None):
+        """
+        Checks that a downloaded file has the size listed in the manifest.
+
+        Args:
+            file_path (pathlib.Path): The downloaded file.
+            expected_size (int | None): The expected size in bytes. Nothing is checked if None.
+            size (int, optional): The number of bytes received, for ranged downloads, whose
+                file is preallocated to its final size. The file size is checked if None.
+
+        Raises:
+            ValueError: If the file size differs from the expected size.
+        """
+        if expected_size is None:
+            return
+        if size is None:
+            size = file_path.stat().st_size
+        if size != expected_size:
+            message = f"Unexpected size for {file_path}: {size} bytes instead of {expected_size}"
+            logger.error(message)
+            raise ValueError(message)
+
+    @staticmethod
+    def check_content_length(response, file_path, expected_size):
+        """
+        Checks the announced size of a response before its body is downloaded.
+
+        An error page or a truncated object served with a success status is then
+        rejected without being streamed to disk. Compressed responses are not
+        checked, since their `Content-Length` is not the size of the file.
+
+        Args:
+            response (requests.Response): The streamed response of the file.
+            file_path (pathlib.Path): The file being downloaded.
+            expected_size (int | None): The size listed in the manifest. Nothing is checked if None.
+
+        Raises:
+            ValueError: If the `Content-Length` header differs from the expected size.
+        """
+        content_length = response.headers.get("Content-Length")
+        if expected_size is None or content_length is None:
+            return
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            return
+        if int(content_length) != expected_size:
+            message = (
+                f"Unexpected Content-Length for {file_path}: "
+                f"{content_length} bytes instead of {expected_size}"
+            )
+            logger.error(message)
+            raise ValueError(message)
+
+    @staticmethod
+    def check_md5(file_path, md5, expected_md5):
+        """
+        Checks the MD5 digest computed while downloading a file against the manifest.
 
-                    if attempt == self.max_retries:
-                        logger.error(f"Max retries reached for {file_path}. Giving up.")
-                        raise
-                    else:
-                        logger.info(f"Retrying download for {file_path}...")
+        Args:
+            file_path (pathlib.Path): The downloaded file.
+            md5 (str | None): The digest returned by `download_file`. Nothing is
+                checked if None (e.g. for ranged downloads, which `_ranged_download`
+                checks once assembled).
+            expected_md5 (str | None): The checksum listed in the manifest. Nothing
+                is checked if None.
+
+        Raises:
+            ValueError: If the digests differ.
+        """
+        if md5 is None or expected_md5 is None:
+            return
+        if md5 != expected_md5:
+            message = f"Unexpected MD5 for {file_path}: {md5} instead of {expected_md5}"
+            logger.error(message)
+            raise ValueError(message)
+
+    @staticmethod
+    def check_content_range(response, file_url, start, end):
+        """
+        Checks that a partial response covers exactly the requested byte range.
 
-    def download_tile(self, tile_id):
+        Args:
+            response (requests.Response): The streamed response of a `Range` request.
+            file_url (str): URL of the file.
+            start (int): First byte of the requested range.
+            end (int): Last byte of the requested range (inclusive).
+
+        Raises:
+            ValueError: If the `Content-Range` header is missing or covers another range.
+        """
+        content_range = response.headers.get("Content-Range", "")
+        match = CONTENT_RANGE_RE.fullmatch(content_range.strip())
+        if match is None or (int(match.group(1)), int(match.group(2))) != (start, end):
+            message = f"Unexpected Content-Range for {file_url}: {content_range!r} instead of bytes {start}-{end}"
+            logger.error(message)
+            raise ValueError(message)
+
+    def _ranged_download(self, session, file_url, file_path, size, expected_md5=None,
+        num_parts=RANGED_DOWNLOAD_PARTS):
+        """
+        Downloads a large file as several byte ranges fetched in parallel.
+
+        A `.part` file is pre-allocated to the final size and every worker writes its
+        range at the corresponding offset. Each response must announce the requested
+        range in its `Content-Range` header and deliver all of its bytes, otherwise
+        the pre-allocated file would keep a zero-filled gap of the right size. Once
+        every range has been written, the assembled file is hashed and checked
+        against the manifest, then renamed to `file_path`.
+
+        Args:
+            session (requests.Session): An authenticated session for making HTTP requests.
+            file_url (str): URL of the file.
+            file_path (pathlib.Path): Path where the file is saved.
+            size (int): Size of the file in bytes, from the `Content-Length` header.
+            expected_md5 (str, optional): MD5 checksum of the file, as listed in the manifest.
+            num_parts (int, optional): Number of ranges fetched concurrently.
+
+        Returns:
+            int: The number of bytes received.
+
+        Raises:
+            ValueError: If the server ignores the `Range` header, answers with another
+                range, delivers a short range, or if the assembled file has another MD5.
+        """
+        part_path = file_path.with_name(f"{file_path.name}.part")
+        with part_path.open("wb") as file:
+            preallocate(file, size)
+            file.truncate(size)
+
+        part_size = -(-size // num_parts)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        logger.info("Downloading %s (%s bytes) in %s ranges", file_path, size, len(ranges))
+
+        def fetch_range(byte_range):
+            start, end = byte_range
+            headers = {"Range": f"bytes={start}-{end}"}
+            with self._download_slots, self._get(
+                session, file_url, headers=headers, allow_redirects=True, stream=True, timeout=DOWNLOAD_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise ValueError(f"Range request not honored for {file_url} (HTTP {response.status_code})")
+                self.check_content_range(response, file_url, start, end)
+                written = download_file_range(response, part_path, start)
+            if written != end - start + 1:
+                raise ValueError(
+                    f"Short range for {file_url}: {written} bytes instead of {end - start + 1} "
+                    f"for bytes {start}-{end}"
+                )
+            return written
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                received = sum(executor.map(fetch_range, ranges))
+            if expected_md5 is not None:
+                with part_path.open("rb") as file:
+                    md5 = hashlib.file_digest(file, "md5").hexdigest()
+                self.check_md5(file_path, md5, expected_md5)
+        except Exception:
+            part_path.unlink(missing_ok=True)
+            raise
+        os.replace(part_path, file_path)
+        logger.info("%s downloaded successfully.", file_path)
+        return received
+
+    def _iter_products(self, tile_id, date_ranges):
         """
-        Downloads all Sentinel-2 products for a given tile across multiple date ranges.
+        Yields the products of a tile within a batch of date ranges.
+
+        The catalogue is paginated lazily: the next page (`@odata.nextLink`) is
+        only requested once every product of the current one has been consumed.
+
+        Args:
+            tile_id (str): The tile (or footprint) ID to download data for.
+            date_ranges (list of tuples): (start, end) pairs in ISO 8601 format.
+
+        Yields:
+            dict: The metadata of each product, as returned by the catalogue.
+        """
+        query = self.get_query(tile_id, date_ranges)
+        while query:
+            data = self.get_catalog_page(query)
+            yield from data.get("value", [])
+            query = data.get("@odata.nextLink")
+
+    def download_tile_range(self, session, tile_id, date_ranges):
+        """
+        Downloads all the products of a tile within a batch of date ranges.
 
         This method:
-        1. Iterates through predefined date ranges.
-        2. Constructs a query to fetch available Sentinel-2 products for the tile.
-        3. Sends a request to retrieve product metadata.
-        4. Iterates through each product, initializing a session and downloading the product files.
-        5. Introduces a delay between requests to prevent excessive API calls.
+        1. Constructs a single query combining every date range of the batch.
+        2. Retrieves the product metadata page by page with `self._iter_products()`.
+        3. Submits each product to a pool of `self.max_parallel_products` workers
+           as soon as it is listed, so the next catalogue page is fetched while
+           the first products are downloading.
 
         Args:
-            tile_id (str): The Sentinel-2 tile ID to download data for.
+            session (requests.Session): An authenticated session, shared across tiles.
+            tile_id (str): The tile (or footprint) ID to download data for.
+            date_ranges (list of tuples): (start, end) pairs in ISO 8601 format.
+
+        Raises:
+            Exception: The first error raised by a product, once every product
+                has been attempted.
 
         Notes:
+            - After `CIRCUIT_BREAKER_THRESHOLD` consecutive product failures, or
+              right away if the credentials are refused (HTTP 401/403), the
+              shared circuit breaker trips and the remaining products of the
+              running jobs are skipped instead of failing one by one after
+              their retries. The next jobs wait `CIRCUIT_BREAKER_COOLDOWN`
+              seconds, then a single trial product decides whether downloads
+              resume or the breaker opens again.
             - Uses `self.get_query()` to construct the API request URL.
-            - Uses `self.init_session()` to authenticate before downloading.
             - Uses `self.download_product()` to handle the actual file downloads.
-            - Introduces a **10-second delay** (`time.sleep(10)`) between iterations to avoid rate limits.
+            - Requests wait on the shared token bucket instead of sleeping a fixed
+              amount of time between date ranges.
         """
-        for initial_date, last_date in self.date_ranges:
-            logger.info(f"Downloading from {initial_date} to {last_date}")
-            query = self.get_query(tile_id, initial_date, last_date)
-            response = requests.get(query)
-            data = response.json()
-            
-            desc = f"Downloading tile {tile_id} from {initial_date[:10]} to {last_date[:10]}"
-            for SAFE_product in tqdm(data.get("value", []), desc=desc):
-                print()            
-                with self.init_session() as session:
-                    self.download_product(session, SAFE_product)
+        initial_date, last_date = date_ranges[0][0], date_ranges[-1][1]
+        logger.info("Downloading tile %s from %s to %s", tile_id, initial_date, last_date)
+
+        breaker = self._breaker
+        breaker.wait()
+
+        def run_product(SAFE_product):
+            breaker.check()
+            try:
+                self.download_product(session, SAFE_product)
+            except Exception as e:
+                breaker.record_failure(e)
+                raise
+            breaker.record_success()
+
+        failures = []
+        skipped = False
+        with ThreadPoolExecutor(max_workers=self.max_parallel_products) as executor:
+            futures = {}
+            for SAFE_product in self._iter_products(tile_id, date_ranges):
+                if breaker.is_open:
+                    skipped = True
+                    break
+                futures[executor.submit(run_product, SAFE_product)] = SAFE_product["Name"]
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    failures.append((futures[future], future.exception()))
+
+        errors = [error for _, error in failures if not isinstance(error, CircuitOpenError)]
+        if failures:
+            failed_products = [product_name for product_name, _ in failures]
+            logger.error("%s products of tile %s failed to download: %s", len(failures), tile_id, failed_products)
+        if skipped or len(errors) < len(failures):
+            logger.error("Skipped the remaining products of tile %s from %s to %s", tile_id, initial_date, last_date)
+            errors.append(CircuitOpenError(f"Circuit open, skipped products of tile {tile_id}"))
+        if errors:
+            raise errors[0]
+
+    def download_tiles(self, tile_ids):
+        """
+        Downloads all products for the given tiles across every date range.
+
+        The monthly date ranges are grouped in batches of `DATE_RANGES_PER_QUERY`,
+        each batch being fetched with a single catalogue query. Every (tile, batch)
+        pair is independent, so they are processed by a bounded pool of
+        `self.max_parallel_ranges` workers sharing one authenticated session.
+        The global request rate is still bounded by the token bucket.
 
-            time.sleep(10)
+        A single progress bar counts the files of the whole run; its total grows
+        as the file list of each product becomes known.
+
+        Args:
+            tile_ids (Iterable[str]): The tile (or footprint) IDs to download.
+
+        Raises:
+            Exception: The first error raised by a job, once every job has finished.
+        """
+        batches = [
+            self.date_ranges[i:i + DATE_RANGES_PER_QUERY]
+            for i in range(0, len(self.date_ranges), DATE_RANGES_PER_QUERY)
+        ]
+        jobs = [(tile_id, batch) for tile_id in tile_ids for batch in batches]
+        if not jobs:
+            return
+
+        def run_job(job):
+            tile_id, date_ranges = job
+            try:
+                self.download_tile_range(session, tile_id, date_ranges)
+            except Exception as e:
+                initial_date, last_date = date_ranges[0][0], date_ranges[-1][1]
+                logger.error("Failed to download tile %s from %s to %s: %s", tile_id, initial_date, last_date, e)
+                return e
+            return None
+
+        self._progress = tqdm(total=0, unit="file", desc="Downloading files")
+        try:
+            with self.init_session() as session:
+                with ThreadPoolExecutor(max_workers=min(self.max_parallel_ranges, len(jobs))) as executor:
+                    errors = [error for error in executor.map(run_job, jobs) if error is not None]
+        finally:
+            self._progress.close()
+            self._progress = None
+
+        if errors:
+            raise errors[0]
     
     @abstractmethod
     def download(self):
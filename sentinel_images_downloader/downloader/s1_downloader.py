@@ -1,7 +1,7 @@
-from sentinel_images_downloader.downloader.base_downloader import SentinelDownloader
+from sentinel_images_downloader.downloader.base_downloader import CATALOG_PAGE_SIZE, SentinelDownloader
 from sentinel_images_downloader.utils.io_utils import load_json, resolve_config_path
+from sentinel_images_downloader.utils.validation import check_raster, check_tiff
 from pathlib import Path 
-import rasterio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,7 +9,7 @@ logger = logging.getLogger(__name__)
 class Sentinel1(SentinelDownloader):
     def __init__(self, username, password, footprints_path, orbit_direction,
         product_type, polarization_mode, initial_date, last_date, output_dir,
-        max_retries,
+        max_retries, **kwargs,
         ):   
         """
         Args:
@@ -17,8 +17,10 @@ class Sentinel1(SentinelDownloader):
             orbit_direction (str): Orbit direction (can be "ASCENDING" or "DESCENDING").
             product_type (str): Sentinel-1 product type (e.g., "GRDH", "SLC").
             polarization_mode (list[str]): Polarization modes (e.g., ["VV", "VH"]).
+            **kwargs: Optional tuning parameters forwarded to `SentinelDownloader`.
         """   
-        super().__init__(username, password, initial_date, last_date, output_dir, max_retries)
+        super().__init__(username, password, initial_date, last_date, output_dir, max_retries,
+            **kwargs)
         self.data_collection = 'SENTINEL-1'
 
         self.orbit_direction = orbit_direction
@@ -27,6 +29,9 @@ class Sentinel1(SentinelDownloader):
 
         self.footprints_path = resolve_config_path(footprints_path)
         self.footprints = load_json(self.footprints_path)
+        self._query_templates = {
+            tile_id: self._build_query_template(tile_id) for tile_id in self.footprints
+        }
 
     def __repr__(self):
         """
@@ -56,33 +61,47 @@ class Sentinel1(SentinelDownloader):
         description = ", ".join(attributes)
         return f"Sentinel-1({description})"
 
-    def get_query(self, tile_id, initial_date, last_date):
+    def _build_query_template(self, tile_id):
         """
-        Constructs an OData query for retrieving Sentinel-1 products from the Copernicus Data Space API.
+        Builds the OData query of a footprint, leaving the date filter as a format field.
 
         Args:
             tile_id (str): An ID for the footprint of interset.
-            initial_date (str): The start date for the query in the format 'YYYY-MM-DD'.
-            last_date (str): The end date for the query in the format 'YYYY-MM-DD'.
 
         Returns:
-            str: A formatted OData query string.
+            str: A query template with a `{date_filter}` field.
         """
         aoi = self.footprints[tile_id]
         footprint = ", ".join(aoi)
         query = [
             f"{self.data_url}/Products?$filter=Collection/Name eq '{self.data_collection}'",
-            f"ContentDate/Start ge {initial_date}",
-            f"ContentDate/End le {last_date}",
+            "{date_filter}",
             f"OData.CSC.Intersects(area=geography'SRID=4326;POLYGON(({footprint}))')",
             "Attributes/OData.CSC.StringAttribute/any(att:att/Name eq 'orbitDirection'",
             f"att/OData.CSC.StringAttribute/Value eq '{self.orbit_direction}')",
             f"contains(Name, '{self.product_type}')",
             "not (contains(Name, 'COG'))",
-            "Online eq True&$top=20&$orderby=ContentDate/Start asc",
+            f"Online eq True&$top={CATALOG_PAGE_SIZE}&$orderby=ContentDate/Start asc",
         ]
         return " and ".join(query)
 
+    def get_query(self, tile_id, date_ranges):
+        """
+        Constructs an OData query for retrieving Sentinel-1 products from the Copernicus Data Space API.
+
+        The constant part of the query is prebuilt per footprint in `__init__`,
+        only the date ranges are filled in here.
+
+        Args:
+            tile_id (str): An ID for the footprint of interset.
+            date_ranges (list of tuples): (start, end) pairs in ISO 8601 format, combined with `or`.
+
+        Returns:
+            str: A formatted OData query string.
+        """
+        date_filter = self._combined_date_predicate(date_ranges)
+        return self._query_templates[tile_id].format(date_filter=date_filter)
+
     def filter_images(self, files_list):
         """
         Filters image files based on specific criteria.
@@ -105,30 +124,32 @@ class Sentinel1(SentinelDownloader):
 
         This method:
         1. Prints a summary of the current download configuration (`self.__repr__()`).
-        2. Iterates over all tile IDs stored in `self.tile_ids`.
-        3. Calls `self.download_tile(tile_id)` to handle the download process for each tile.
+        2. Calls `self.download_tiles()` with the footprints stored in `self.footprints`, which
+           processes every (tile, date range) pair in parallel.
 
         Notes:
-            - The `self.download_tile()` method is responsible for querying and downloading products.
+            - The `self.download_tile_range()` method is responsible for querying and downloading products.
             - This function acts as the main entry point for triggering the download process.
         """
         logger.info(self)
-        for tile_id in self.footprints:
-            self.download_tile(tile_id)
+        self.download_tiles(self.footprints)
 
     def validate_download(self, file_path):
         """
         Validates the downloaded file.
 
+        TIFF files are checked for their header, and also opened with rasterio
+        when `deep_validate` is set.
+
         Raises:
-            Exception: If the file is corrupt or unreadable.
+            ValueError: If the file is corrupt or unreadable.
         """
         if file_path.suffix.lower() not in {".tif", ".tiff"}:
             return
         try:
-            with rasterio.open(file_path) as src:
-                src.meta
-        except Exception as e:
-            message = f"Invalid TIFF file: {e}"
-            logger.error(message)
-            raise ValueError(message)
\ No newline at end of file
+            check_tiff(file_path)
+            if self.deep_validate:
+                check_raster(file_path)
+        except ValueError as e:
+            logger.error("Invalid TIFF file: %s", e)
+            raise
\ No newline at end of file
@@ -1,30 +1,41 @@
-import rasterio
-from sentinel_images_downloader.downloader.base_downloader import SentinelDownloader
+from sentinel_images_downloader.downloader.base_downloader import CATALOG_PAGE_SIZE, SentinelDownloader
 from sentinel_images_downloader.utils.io_utils import load_json, resolve_config_path
+from sentinel_images_downloader.utils.validation import check_jp2, check_raster
 from pathlib import Path 
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Band token at the end of an image name, e.g. "B02" in "..._B02.jp2" (L1C)
+# or "B02" and "10m" in "..._B02_10m.jp2" (L2A)
+BAND_RE = re.compile(r"_([A-Z0-9]{3})(?:_(\d+m))?\.\w+$")
+
 class Sentinel2(SentinelDownloader):
     def __init__(self, username, password, tile_ids, product_level, relative_orbits_path, 
-        initial_date, last_date, band_selection, output_dir, max_retries):
+        initial_date, last_date, band_selection, output_dir, max_retries, **kwargs):
         """
         Args:
             tile_ids (list[str]): Ids of the tiles to download.
             product_level (str): Level of the product (can be "L1C" or "L2A").
             relative_orbits_path (str): Path to JSON containing orbit for each tile.
             band_selection (list[str]): Bands to download.
+            **kwargs: Optional tuning parameters forwarded to `SentinelDownloader`.
         """
-        super().__init__(username, password, initial_date, last_date, output_dir, max_retries)
+        super().__init__(username, password, initial_date, last_date, output_dir, max_retries,
+            **kwargs)
         self.data_collection = 'SENTINEL-2'
 
         self.tile_ids = tile_ids
         self.product_level = product_level
         self.band_selection = band_selection
+        self._band_set = set(band_selection)
 
         self.relative_orbits_path = resolve_config_path(relative_orbits_path)
         self.orbits = load_json(self.relative_orbits_path)
+        self._query_templates = {
+            tile_id: self._build_query_template(tile_id) for tile_id in self.tile_ids
+        }
 
     def __repr__(self):
         """
@@ -52,36 +63,61 @@ class Sentinel2(SentinelDownloader):
         description = ", ".join(attributes)
         return f"Sentinel-2({description})"
 
-    def get_query(self, tile_id, initial_date, last_date):
+    def _build_query_template(self, tile_id):
         """
-        Constructs an OData query for retrieving Sentinel-2 products from the Copernicus Data Space API.
+        Builds the OData query of a tile, leaving the date filter as a format field.
 
         Args:
             tile_id (str): The Sentinel-2 tile ID to filter results.
-            initial_date (str): The start date for the query in the format 'YYYY-MM-DD'.
-            last_date (str): The end date for the query in the format 'YYYY-MM-DD'.
 
         Returns:
-            str: A formatted OData query string.
+            str: A query template with a `{date_filter}` field.
         """
         query = [
             f"{self.data_url}/Products?$filter=Collection/Name eq '{self.data_collection}'",
-            f"ContentDate/Start ge {initial_date}",
-            f"ContentDate/End le {last_date}",
+            "{date_filter}",
             f"contains(Name, '{tile_id}')",
             f"contains(Name, '{self.product_level}')",
             f"contains(Name, '{self.orbits[tile_id]}')",
-            "Online eq True&$top=500&$orderby=ContentDate/Start asc",
+            f"Online eq True&$top={CATALOG_PAGE_SIZE}&$orderby=ContentDate/Start asc",
         ]
         return " and ".join(query)
 
+    def get_query(self, tile_id, date_ranges):
+        """
+        Constructs an OData query for retrieving Sentinel-2 products from the Copernicus Data Space API.
+
+        The constant part of the query, including the relative orbit of the tile,
+        is prebuilt per tile in `__init__`, only the date ranges are filled in here.
+
+        Args:
+            tile_id (str): The Sentinel-2 tile ID to filter results.
+            date_ranges (list of tuples): (start, end) pairs in ISO 8601 format, combined with `or`.
+
+        Returns:
+            str: A formatted OData query string.
+        """
+        date_filter = self._combined_date_predicate(date_ranges)
+        return self._query_templates[tile_id].format(date_filter=date_filter)
+
+    def get_selection(self):
+        """
+        Returns the selected bands, which define the files kept by `filter_images`.
+
+        Returns:
+            list[str]: The band selection.
+        """
+        return list(self.band_selection)
+
     def filter_images(self, files_list):
         """
         Filters image files based on specific criteria.
 
         This method retains only files located in the "IMG_DATA" directory 
-        and further filters them to include only those containing one of 
-        the specified bands.
+        and further filters them to include only those of the specified bands.
+        The band token is read once from each file name and looked up in the
+        band selection, either with its resolution (e.g. "B02_10m") or
+        without it (e.g. "B02", which selects every resolution).
 
         Args:
             files_list (list of str): List of file paths to be filtered.
@@ -89,8 +125,17 @@ class Sentinel2(SentinelDownloader):
         Returns:
             list of str: A filtered list of file paths that match the criteria.
         """
-        img_data_files = [file for file in files_list if "IMG_DATA" in file]
-        return [file for file in img_data_files if any(band in file for band in self.band_selection)]
+        selected = []
+        for file in files_list:
+            if "IMG_DATA" not in file:
+                continue
+            match = BAND_RE.search(file)
+            if match is None:
+                continue
+            band, resolution = match.groups()
+            if band in self._band_set or f"{band}_{resolution}" in self._band_set:
+                selected.append(file)
+        return selected
 
     def download(self):
         """
@@ -98,31 +143,34 @@ class Sentinel2(SentinelDownloader):
 
         This method:
         1. Prints a summary of the current download configuration (`self.__repr__()`).
-        2. Iterates over all tile IDs stored in `self.tile_ids`.
-        3. Calls `self.download_tile(tile_id)` to handle the download process for each tile.
+        2. Calls `self.download_tiles()` with the tiles stored in `self.tile_ids`, which
+           processes every (tile, date range) pair in parallel.
 
         Notes:
-            - The `self.download_tile()` method is responsible for querying and downloading products.
+            - The `self.download_tile_range()` method is responsible for querying and downloading products.
             - This function acts as the main entry point for triggering the download process.
         """
         logger.info(self)
-        for tile_id in self.tile_ids:
-            self.download_tile(tile_id)
+        self.download_tiles(self.tile_ids)
 
     def validate_download(self, file_path):
         """
         Validates the downloaded file.
 
+        JP2 files are checked for their signature box and end of codestream
+        marker, which detects truncated downloads without decoding them. With
+        `deep_validate`, they are also opened with rasterio.
+
         Raises:
-            Exception: If the file is corrupt or unreadable.
+            ValueError: If the file is corrupt or unreadable.
         """
         if file_path.suffix.lower() != ".jp2":
             return
         try:
-            with rasterio.open(file_path) as src:
-                src.meta
+            check_jp2(file_path)
+            if self.deep_validate:
+                check_raster(file_path)
 
-        except Exception as e:
-            message = f"Invalid JP2 file: {e}"
-            logger.error(message, exc_info=True)
-            raise ValueError(message)
\ No newline at end of file
+        except ValueError as e:
+            logger.error("Invalid JP2 file: %s", e)
+            raise
\ No newline at end of file
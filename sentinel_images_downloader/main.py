@@ -9,16 +9,11 @@ from environment variables and starts the download process.
 from sentinel_images_downloader.downloader.s1_downloader import Sentinel1
 from sentinel_images_downloader.downloader.s2_downloader import Sentinel2
 from sentinel_images_downloader.utils.io_utils import load_json, resolve_config_path
-from sentinel_images_downloader.config.path import LOGS_DIR
+from sentinel_images_downloader.config.credentials import get_credentials
+from sentinel_images_downloader.config.logger import setup_logger
+from sentinel_images_downloader.config.path import LOGS_DIR, init_paths
 from datetime import datetime
-from dotenv import load_dotenv
 import argparse
-import os
-
-from sentinel_images_downloader.config.logger import setup_logger
-today = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-log_path = LOGS_DIR / f"{today}.log"
-logger = setup_logger(file_name=log_path)
 
 # Mapping of satellite names to their respective downloader classes
 SATELLITE_DOWNLOADERS = {
@@ -48,18 +43,44 @@ def main():
         required=False, type=str,
         default=None
     )
+    parser.add_argument(
+        "-w", "--workers",
+        help="Number of files of a product downloaded concurrently (overrides max_parallel_files).",
+        required=False, type=int,
+        default=None
+    )
+
+    parser.add_argument(
+        "--log-level",
+        help="Minimum level of the logged messages.",
+        required=False, type=str.upper,
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"]
+    )
+    parser.add_argument(
+        "--deep-validate",
+        help="Also open every downloaded raster with rasterio (slower than the header checks).",
+        action="store_true"
+    )
 
     args = parser.parse_args()
-    load_dotenv()
+
+    init_paths()
+    today = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+    log_path = LOGS_DIR / f"{today}.log"
+    logger = setup_logger(file_name=log_path, level=args.log_level)
 
     # Determine config file name (use default if not provided)
     config_path = args.config_path or f"{args.satellite}_default_config.json"
     config_path = resolve_config_path(config_path)
     config = load_json(config_path)
+    if args.workers is not None:
+        config["max_parallel_files"] = args.workers
+    if args.deep_validate:
+        config["deep_validate"] = True
 
     # Retrieve authentication credentials
-    username = os.getenv("COPERNICUS_USERNAME")
-    password = os.getenv("COPERNICUS_PASSWORD")
+    username, password = get_credentials()
 
     # Initialize and start the downloader
     DownloaderClass = SATELLITE_DOWNLOADERS[args.satellite]
@@ -1,47 +1,74 @@
-from sentinel_images_downloader.config.endpoints import LOGIN_URL
+from sentinel_images_downloader.config.endpoints import AUTH_DOMAIN, LOGIN_URL, USER_AGENT
+from sentinel_images_downloader.utils.io_utils import load_json, loads_json, write_file_atomic
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 import requests
+import threading
+import base64
+import json
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
-def get_keycloak(username, password, client_id="cdse-public"):
+@lru_cache(maxsize=1)
+def get_keycloak_session():
     """
-    Obtains an access token from Keycloak for authentication.
+    Returns the session used to request access tokens from Keycloak.
+
+    The session is created on the first call and shared afterwards, so token
+    renewals reuse the keep-alive connection to the identity server instead of
+    opening a new TLS connection each time. Transient gateway errors (502, 503,
+    504) are retried by the mounted adapter.
+
+    Returns:
+        requests.Session: The shared Keycloak session.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries))
+    return session
+
+def request_token(data):
+    """
+    Sends a token request to Keycloak.
 
     Args:
-        username (str): The username for authentication.
-        password (str): The password associated with the username.
-        client_id (str): The Keycloak client ID.
+        data (dict): The form data of the request, including its `grant_type`.
 
     Returns:
-        str: The access token received from Keycloak.
+        dict: The token response, with at least an "access_token" and, when
+        Keycloak provides them, "expires_in", "refresh_token" and "refresh_expires_in".
 
     Raises:
         Exception: If the request to Keycloak fails or 
                    an access token is not found.
     """
-    data = {
-        "client_id": client_id,
-        "username": username,
-        "password": password,
-        "grant_type": "password",
-    }
-
+    response = None
     try:
         logger.info("Sending request to Keycloak...")
-        response = requests.post(
+        response = get_keycloak_session().post(
             LOGIN_URL,
             data=data,
             allow_redirects=True,
         )
         response.raise_for_status()
 
-        token = response.json().get("access_token")
-        if not token:
+        token_data = loads_json(response.content)
+        if not token_data.get("access_token"):
             raise Exception("Access token not found in the response.")
 
         logger.info("Access token retrieved successfully.")
-        return token
+        return token_data
 
     except requests.exceptions.HTTPError as http_err:
         message = f"HTTP error occurred: {http_err} - {response.text}"
@@ -54,6 +81,257 @@ def get_keycloak(username, password, client_id="cdse-public"):
         raise Exception(message) from req_err
     
     except Exception as e:
-        message = f"Keycloak token creation failed. Response: {response.text}"
+        response_text = response.text if response is not None else "no response"
+        message = f"Keycloak token creation failed. Response: {response_text}"
         logger.error(message)
-        raise Exception(message) from e
\ No newline at end of file
+        raise Exception(message) from e
+
+def get_keycloak(username, password, client_id="cdse-public"):
+    """
+    Obtains an access token from Keycloak for authentication.
+
+    Args:
+        username (str): The username for authentication.
+        password (str): The password associated with the username.
+        client_id (str): The Keycloak client ID.
+
+    Returns:
+        str: The access token received from Keycloak.
+
+    Raises:
+        Exception: If the request to Keycloak fails or 
+                   an access token is not found.
+    """
+    data = {
+        "client_id": client_id,
+        "username": username,
+        "password": password,
+        "grant_type": "password",
+    }
+    return request_token(data)["access_token"]
+
+def get_token_expiry(token):
+    """
+    Reads the expiration time of a JWT access token.
+
+    The token is not verified, only its payload is decoded to get the `exp` claim.
+
+    Args:
+        token (str): The access token returned by Keycloak.
+
+    Returns:
+        float: The expiration time as a Unix timestamp, or 0.0 if it cannot be read.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+
+    except (IndexError, KeyError, TypeError, ValueError) as e:
+        logger.warning("Could not read the access token expiry: %s", e)
+        return 0.0
+
+class TokenProvider:
+    """
+    Thread-safe provider of Keycloak access tokens.
+
+    The token is fetched on first use and reused until it is about to expire,
+    so concurrent workers share a single token instead of each logging in.
+    Expired tokens are renewed with the refresh token when it is still valid,
+    and with the username and password otherwise.
+
+    If `cache_path` is given, the tokens are also saved there (readable by the
+    owner only) and reused by later runs of the same user and client, which
+    then do not need to log in again.
+
+    Attributes:
+        username (str): The username for authentication.
+        password (str): The password associated with the username.
+        client_id (str): The Keycloak client ID.
+        margin (float): Seconds before expiry at which the token is renewed.
+        default_lifetime (float): Lifetime assumed when the token expiry cannot be read.
+        cache_path (pathlib.Path | None): File where the tokens are cached across runs.
+    """
+    def __init__(self, username, password, client_id="cdse-public", margin=60, default_lifetime=600,
+        cache_path=None):
+        self.username = username
+        self.password = password
+        self.client_id = client_id
+        self.margin = margin
+        self.default_lifetime = default_lifetime
+        self.cache_path = cache_path
+
+        self._token = None
+        self._expiry = 0.0
+        self._refresh_token = None
+        self._refresh_expiry = 0.0
+        self._cache_loaded = False
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        Returns a valid access token, requesting a new one if needed.
+
+        Returns:
+            str: The access token.
+        """
+        with self._lock:
+            if not self._cache_loaded:
+                self._load_cache()
+                self._cache_loaded = True
+
+            now = time.time()
+            if self._token is not None and now < self._expiry - self.margin:
+                return self._token
+
+            token_data = None
+            if self._refresh_token is not None and now < self._refresh_expiry - self.margin:
+                try:
+                    token_data = request_token({
+                        "client_id": self.client_id,
+                        "refresh_token": self._refresh_token,
+                        "grant_type": "refresh_token",
+                    })
+                except Exception as e:
+                    logger.warning("Could not refresh the access token, logging in again: %s", e)
+
+            if token_data is None:
+                token_data = request_token({
+                    "client_id": self.client_id,
+                    "username": self.username,
+                    "password": self.password,
+                    "grant_type": "password",
+                })
+            self._store(token_data, now)
+            return self._token
+
+    def _store(self, token_data, now):
+        """
+        Keeps the tokens of a Keycloak response and saves them to the cache file.
+
+        Args:
+            token_data (dict): The token response, as returned by `request_token`.
+            now (float): Unix timestamp of the request.
+        """
+        self._token = token_data["access_token"]
+        self._expiry = get_token_expiry(self._token) or now + token_data.get("expires_in", self.default_lifetime)
+        self._refresh_token = token_data.get("refresh_token")
+        self._refresh_expiry = now + token_data.get("refresh_expires_in", 0) if self._refresh_token else 0.0
+        if self.cache_path is None:
+            return
+
+        cache = {
+            "username": self.username,
+            "client_id": self.client_id,
+            "access_token": self._token,
+            "expires_at": self._expiry,
+            "refresh_token": self._refresh_token,
+            "refresh_expires_at": self._refresh_expiry,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            write_file_atomic(self.cache_path, json.dumps(cache).encode())
+        except OSError as e:
+            logger.warning("Could not cache the access token in %s: %s", self.cache_path, e)
+
+    def _load_cache(self):
+        """
+        Restores the tokens saved by a previous run, if they belong to the same user and client.
+        """
+        if self.cache_path is None or not self.cache_path.is_file():
+            return
+        try:
+            cache = load_json(self.cache_path)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable token cache %s: %s", self.cache_path, e)
+            return
+        if cache.get("username") != self.username or cache.get("client_id") != self.client_id:
+            return
+
+        self._token = cache.get("access_token")
+        self._expiry = float(cache.get("expires_at") or 0.0)
+        self._refresh_token = cache.get("refresh_token")
+        self._refresh_expiry = float(cache.get("refresh_expires_at") or 0.0)
+
+    def invalidate(self, token):
+        """
+        Discards a token rejected by the server, so the next call to `get` renews it.
+
+        Args:
+            token (str): The rejected token. Nothing happens if it was already replaced.
+        """
+        with self._lock:
+            if self._token == token:
+                self._token = None
+
+class BearerAuth(AuthBase):
+    """
+    Requests authentication handler that sets the Bearer token of a `TokenProvider`.
+
+    The token is read on every request, so token rotation is transparent to the
+    session and its connection pool. If the server answers `401 Unauthorized`
+    (e.g. the token was revoked before its expiry), the token is renewed and
+    the request is sent again once.
+    """
+    def __init__(self, provider):
+        self.provider = provider
+
+    def __call__(self, request):
+        request.headers["Authorization"] = f"Bearer {self.provider.get()}"
+        if self.handle_401 not in request.hooks["response"]:
+            request.register_hook("response", self.handle_401)
+        return request
+
+    def handle_401(self, response, **kwargs):
+        """
+        Response hook that retries a request rejected with HTTP 401 using a new token.
+
+        Args:
+            response (requests.Response): The server response.
+            **kwargs: Arguments of the original `send` call (stream, timeout, ...).
+
+        Returns:
+            requests.Response: The original response, or the response to the retried request.
+        """
+        if response.status_code != 401:
+            return response
+
+        rejected_token = response.request.headers["Authorization"].removeprefix("Bearer ")
+        logger.warning("Access token rejected by the server. Requesting a new one...")
+        self.provider.invalidate(rejected_token)
+        response.close()
+
+        request = response.request.copy()
+        request.headers["Authorization"] = f"Bearer {self.provider.get()}"
+        retried_response = response.connection.send(request, **kwargs)
+        retried_response.history.append(response)
+        retried_response.request = request
+        return retried_response
+
+class AuthSession(requests.Session):
+    """
+    Session that keeps its authentication on redirects within a trusted domain.
+
+    `requests` drops the `Authorization` header when a redirect leads to another
+    host, but the Copernicus download service redirects to other hosts of its
+    own domain that still require the Bearer token. The session authentication
+    is applied again to these redirected requests, as long as they use HTTPS.
+    It is still dropped for any host outside `trusted_domain`, and on a
+    downgrade to plain HTTP, which would send the token in cleartext.
+
+    Attributes:
+        trusted_domain (str): Domain whose hosts receive the session authentication.
+    """
+    def __init__(self, trusted_domain=AUTH_DOMAIN):
+        super().__init__()
+        self.trusted_domain = trusted_domain
+
+    def rebuild_auth(self, prepared_request, response):
+        super().rebuild_auth(prepared_request, response)
+        url = urlparse(prepared_request.url)
+        host = url.hostname or ""
+        if self.auth is None or url.scheme != "https":
+            return
+        if host == self.trusted_domain or host.endswith(f".{self.trusted_domain}"):
+            prepared_request.prepare_auth(self.auth)
@@ -0,0 +1,119 @@
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(RuntimeError):
+    """Raised for the work skipped once a circuit breaker has tripped."""
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker counting consecutive failures.
+
+    The breaker trips (opens) after `threshold` consecutive failures, or right
+    away on an error that retrying other items cannot fix (e.g. HTTP 401/403,
+    meaning the credentials are refused). Any success resets the count.
+
+    Once `cooldown` seconds have passed, an open breaker becomes half-open: a
+    single trial item is let through while the others wait for its outcome.
+    A successful trial closes the breaker, a failed one opens it again for
+    another cool-down.
+
+    Attributes:
+        threshold (int): Number of consecutive failures that trips the breaker.
+        cooldown (float): Seconds an open breaker waits before letting a trial through.
+        fatal_status_codes (set[int]): HTTP status codes that trip it immediately.
+        state (str): "closed", "open" or "half_open".
+
+    Example:
+        >>> breaker = CircuitBreaker(threshold=5, cooldown=60)
+        >>> breaker.check()  # raises CircuitOpenError while open
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold=5, cooldown=60.0, fatal_status_codes=frozenset({401, 403})):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.fatal_status_codes = fatal_status_codes
+        self.failures = 0
+        self.state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._condition = threading.Condition()
+
+    @property
+    def is_open(self):
+        """bool: Whether the breaker is open and its cool-down has not elapsed yet."""
+        with self._condition:
+            self._update_state()
+            return self.state == self.OPEN
+
+    def _update_state(self):
+        """Moves an open breaker to half-open once its cool-down has elapsed. Expects the lock held."""
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            self.state = self.HALF_OPEN
+            logger.info("Circuit breaker half-open. Letting a single trial through...")
+
+    def check(self):
+        """
+        Raises if the breaker is open.
+
+        While half-open, the first caller is let through as the trial and the
+        others block until the trial succeeds (they then proceed) or fails
+        (they then raise).
+
+        Raises:
+            CircuitOpenError: If the breaker has tripped.
+        """
+        with self._condition:
+            while True:
+                self._update_state()
+                if self.state == self.CLOSED:
+                    return
+                if self.state == self.OPEN:
+                    raise CircuitOpenError(f"Circuit open after {self.failures} consecutive failures")
+                if not self._trial_in_flight:
+                    self._trial_in_flight = True
+                    return
+                self._condition.wait()
+
+    def wait(self):
+        """Blocks until the cool-down of an open breaker has elapsed."""
+        with self._condition:
+            self._update_state()
+            remaining = self._opened_at + self.cooldown - time.monotonic() if self.state == self.OPEN else 0
+        if remaining > 0:
+            logger.info("Circuit breaker open. Waiting %.1f s before resuming...", remaining)
+            time.sleep(remaining)
+
+    def record_success(self):
+        """Resets the count of consecutive failures, closing the breaker."""
+        with self._condition:
+            if self.state != self.CLOSED:
+                logger.info("Circuit breaker closed.")
+            self.failures = 0
+            self.state = self.CLOSED
+            self._trial_in_flight = False
+            self._condition.notify_all()
+
+    def record_failure(self, error):
+        """
+        Counts a failure, tripping the breaker if needed.
+
+        Args:
+            error (Exception): The error of the failed item.
+        """
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        with self._condition:
+            self.failures += 1
+            trips = self.failures >= self.threshold or status_code in self.fatal_status_codes
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and trips):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+                logger.error("Circuit breaker tripped after %s consecutive failures: %s", self.failures, error)
+            self._condition.notify_all()
@@ -1,8 +1,13 @@
 from datetime import datetime, timedelta
+import calendar
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Each range covers whole days, from midnight to the last millisecond
+RANGE_START_TIME = "T00:00:00.000Z"
+RANGE_END_TIME = "T23:59:59.999Z"
+
 def process_dates(initial_date, last_date):
     """
     Generates a list of monthly time ranges between two dates.
@@ -23,8 +28,8 @@ def process_dates(initial_date, last_date):
         ]
     """
     try:
-        start = datetime.strptime(initial_date, "%Y-%m-%d")
-        end = datetime.strptime(last_date, "%Y-%m-%d")
+        start = datetime.strptime(initial_date, "%Y-%m-%d").date()
+        end = datetime.strptime(last_date, "%Y-%m-%d").date()
 
     except ValueError as e:
         message = (
@@ -38,7 +43,7 @@ def process_dates(initial_date, last_date):
     if start > end:
         message = (
             f"Dates were passed in the wrong order: "
-            f"start={start.date()}, end={end.date()}. "
+            f"start={start}, end={end}. "
             f"Swapping them."
         )
         logger.warning(message)
@@ -48,15 +53,13 @@ def process_dates(initial_date, last_date):
     current_start = start
 
     while current_start <= end:
-        next_month_start = (
-            current_start.replace(day=28) + timedelta(days=4)
-        ).replace(day=1)
-        current_end = min(next_month_start - timedelta(seconds=1), end)
+        _, last_day = calendar.monthrange(current_start.year, current_start.month)
+        current_end = min(current_start.replace(day=last_day), end)
 
         monthly_ranges.append((
-            current_start.strftime('%Y-%m-%dT00:00:00.000Z'),
-            current_end.strftime('%Y-%m-%dT23:59:59.999Z'),
+            current_start.isoformat() + RANGE_START_TIME,
+            current_end.isoformat() + RANGE_END_TIME,
         ))
 
-        current_start = current_end + timedelta(seconds=1)
+        current_start = current_end + timedelta(days=1)
     return monthly_ranges
@@ -1,9 +1,18 @@
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 import platform
+import tempfile
+import hashlib
 import json
+import os
 import logging
 
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
 logger = logging.getLogger(__name__)
 
 def process_path(file_path):
@@ -11,10 +20,31 @@ def process_path(file_path):
         file_path = Path(f"\\\\?\\{file_path}")
     return file_path
 
+def loads_json(data):
+    """
+    Decodes a JSON document, with `orjson` when it is installed.
+
+    Args:
+        data (bytes | str): The JSON document.
+
+    Returns:
+        Any: The decoded content.
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed (`orjson.JSONDecodeError`
+            is a subclass of it).
+    """
+    return _json.loads(data)
+
 def load_json(file_path, default_type=None):
     """
     Loads a JSON file and returns its contents as a dictionary. 
     
+    `orjson` is used to decode the file when it is installed. The decoded content
+    is memoized per file path and modification time, so reading the same file
+    again only costs a `stat`. Each call returns a new top-level dictionary,
+    but nested values are shared between calls and must not be modified.
+
     If the file does not exist, returns an empty dictionary or a `defaultdict` 
     if `default_type` is provided.
 
@@ -29,20 +59,31 @@ def load_json(file_path, default_type=None):
         defaultdict if `default_type` is specified.
     """
     if file_path.is_file():
-        logger.info(f"Reading {file_path}...")
-        try:
-            with file_path.open("r", encoding="utf-8") as file:
-                data = json.load(file)
-                return defaultdict(default_type, data) if default_type else data
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Malformed JSON in {file_path}: {e}")
-            raise
+        data = _load_json(file_path, file_path.stat().st_mtime_ns)
+        if default_type:
+            return defaultdict(default_type, data)
+        return dict(data) if isinstance(data, dict) else data
     
     else:
-        logger.warning(f"JSON file not found at {file_path}. Returning empty.") 
+        logger.warning("JSON file not found at %s. Returning empty.", file_path) 
         return defaultdict(default_type) if default_type else {}
 
+@lru_cache(maxsize=32)
+def _load_json(file_path, mtime_ns):
+    """
+    Cached implementation of `load_json`.
+
+    The modification time is part of the cache key, so a file rewritten on disk
+    is read again.
+    """
+    logger.info("Reading %s...", file_path)
+    try:
+        return loads_json(file_path.read_bytes())
+
+    except json.JSONDecodeError as e:
+        logger.error("Malformed JSON in %s: %s", file_path, e)
+        raise
+
 def resolve_config_path(config_name_or_path, default_subdir="examples"):
     path = Path(config_name_or_path)
     if path.is_absolute():
@@ -56,25 +97,130 @@ def resolve_config_path(config_name_or_path, default_subdir="examples"):
         logger.error(message, exc_info=True)
         raise FileNotFoundError(message)
 
-def download_file(response, file_path, chunk_size=8192):
+def write_file_atomic(file_path, data):
+    """
+    Writes bytes to a file atomically.
+
+    The data is written to a temporary file in the same directory, which then
+    replaces `file_path`, so readers never see a partially written file.
+
+    Args:
+        file_path (Path): The path of the file to write.
+        data (bytes): The content of the file.
+    """
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".part", delete=False,
+        ) as file:
+            tmp_path = Path(file.name)
+            file.write(data)
+        os.replace(tmp_path, file_path)
+
+    except Exception as e:
+        logger.error("Failed to write file to %s: %s", file_path, e, exc_info=True)
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+def preallocate(file, size):
+    """
+    Reserves disk space for an open file, where the platform supports it.
+
+    Allocating the whole file up front with `posix_fallocate` lets the file
+    system pick contiguous extents instead of growing the file chunk by chunk.
+    Nothing happens on platforms or file systems without support for it.
+
+    Args:
+        file (io.IOBase): The file, opened for writing.
+        size (int | None): Number of bytes to reserve. Nothing is done if None or 0.
+    """
+    if not size or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(file.fileno(), 0, size)
+    except OSError as e:
+        logger.debug("Could not preallocate %s bytes for %s: %s", size, file.name, e)
+
+def download_file(response, file_path, chunk_size=1 << 20, size=None):
     """
     Downloads a file from an HTTP response and saves it locally.
 
+    The response should be requested with `stream=True`, so that the content
+    is copied chunk by chunk instead of being buffered in memory. It is not
+    closed here: the caller owns it, typically in a `with` block, so that its
+    connection goes back to the pool on every path, including errors raised
+    before the download starts.
+
+    The content is written to a temporary file in the same directory, which is
+    renamed to `file_path` only once complete, so an interrupted download never
+    leaves a partial file. The MD5 digest of the content is computed while
+    writing it, so the file does not have to be read again to be checked. The
+    file is unbuffered and written once per `chunk_size` block, i.e. one
+    `write` syscall per MiB by default.
+
     Args:
         response (requests.Response): The HTTP response object containing the file content.
         file_path (str): The path where the file should be saved.
-        chunk_size (int, optional): The chunk size for writing. Default is 8192 bytes.
+        chunk_size (int, optional): The chunk size for writing. Default is 1 MiB.
+        size (int, optional): Expected size of the file (e.g. its `Content-Length`),
+            preallocated before writing. The file is truncated to the bytes actually
+            received, so a shorter response is still detected by the size checks.
+
+    Returns:
+        str: The MD5 digest of the file, in lowercase hexadecimal.
     """
+    digest = hashlib.md5(usedforsecurity=False)
+    tmp_path = None
     try:
-        with file_path.open("wb") as file:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    file.write(chunk)
-        logger.info(f"{file_path} downloaded successfully.")
+        with tempfile.NamedTemporaryFile(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".part",
+            delete=False, buffering=0,
+        ) as file:
+            tmp_path = Path(file.name)
+            preallocate(file, size)
+            response.raw.decode_content = True
+            while chunk := response.raw.read(chunk_size):
+                file.write(chunk)
+                digest.update(chunk)
+            file.truncate()
+        os.replace(tmp_path, file_path)
+        logger.info("%s downloaded successfully.", file_path)
+        return digest.hexdigest()
 
     except Exception as e:
-        logger.error(f"Failed to write file to {file_path}: {e}", exc_info=True)
+        logger.error("Failed to write file to %s: %s", file_path, e, exc_info=True)
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
         raise
 
-    finally:
-        response.close()
\ No newline at end of file
+def download_file_range(response, file_path, offset, chunk_size=1 << 20):
+    """
+    Writes a partial (HTTP 206) response into an existing file at a given offset.
+
+    Like `download_file`, the file is opened unbuffered and the response is read
+    in `chunk_size` blocks, so each block costs a single `write` syscall. The
+    response is not closed here, the caller owns it.
+
+    Args:
+        response (requests.Response): The streamed response of a `Range` request.
+        file_path (Path): The pre-allocated file to write into.
+        offset (int): Position of the first byte of the range in the file.
+        chunk_size (int, optional): The chunk size for writing. Default is 1 MiB.
+
+    Returns:
+        int: The number of bytes written, to be compared with the length of the range.
+    """
+    written = 0
+    try:
+        with file_path.open("r+b", buffering=0) as file:
+            file.seek(offset)
+            response.raw.decode_content = True
+            while chunk := response.raw.read(chunk_size):
+                file.write(chunk)
+                written += len(chunk)
+        return written
+
+    except Exception as e:
+        logger.error("Failed to write range at %s to %s: %s", offset, file_path, e, exc_info=True)
+        raise
@@ -0,0 +1,153 @@
+from collections import deque
+import threading
+import random
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace the requests sent to the Copernicus API.
+
+    Tokens are refilled continuously at `rate` tokens per second, up to `capacity`.
+    Each request consumes one token, waiting for it if the bucket is empty.
+
+    Attributes:
+        rate (float): Number of tokens added per second.
+        capacity (float): Maximum number of tokens stored (burst size), at least one
+            so that rates below one token per second can still be served.
+
+    Example:
+        >>> bucket = TokenBucket(rate=4)
+        >>> bucket.acquire()  # returns immediately while tokens are available
+    """
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = max(1.0, capacity or rate)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Consumes tokens from the bucket, blocking until they are available.
+
+        Args:
+            tokens (float, optional): Number of tokens to consume. Default is 1.
+        """
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                time.sleep((tokens - self.tokens) / self.rate)
+
+class SlidingWindowLimiter:
+    """
+    Thread-safe limiter allowing at most `limit` requests in any window of `period` seconds.
+
+    The timestamps of the requests sent within the last window are kept, so
+    unlike a token bucket starting full, no burst can exceed the quota, even
+    in the first window.
+
+    Attributes:
+        limit (int): Maximum number of requests per window.
+        period (float): Length of the window in seconds.
+
+    Example:
+        >>> limiter = SlidingWindowLimiter(limit=10000, period=3600)
+        >>> limiter.acquire()  # blocks once 10000 requests were sent within the last hour
+    """
+    def __init__(self, limit, period):
+        self.limit = max(1, int(limit))
+        self.period = period
+        self._timestamps = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Records requests in the window, blocking until the quota allows them.
+
+        Args:
+            tokens (int, optional): Number of requests to record. Default is 1.
+        """
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._timestamps and self._timestamps[0] <= now - self.period:
+                    self._timestamps.popleft()
+                if len(self._timestamps) + tokens <= self.limit:
+                    self._timestamps.extend([now] * tokens)
+                    return
+                time.sleep(self._timestamps[0] + self.period - now)
+
+class RateLimiter:
+    """
+    Combines a per-second token bucket and an optional per-hour sliding window.
+
+    A request is sent only once both limiters allow it, so short bursts are
+    paced by the per-second rate and long runs stay under the hourly quota.
+
+    Attributes:
+        buckets (list[TokenBucket | SlidingWindowLimiter]): The limiters consumed by each request.
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_second=4, requests_per_hour=10000)
+        >>> limiter.acquire()
+    """
+    def __init__(self, requests_per_second, requests_per_hour=None):
+        self.buckets = [TokenBucket(rate=requests_per_second)]
+        if requests_per_hour:
+            self.buckets.append(SlidingWindowLimiter(limit=requests_per_hour, period=3600))
+
+    def acquire(self, tokens=1):
+        """
+        Consumes tokens from every limiter, blocking until they are available.
+
+        Args:
+            tokens (float, optional): Number of tokens to consume. Default is 1.
+        """
+        for bucket in self.buckets:
+            bucket.acquire(tokens)
+
+def get_retry_delay(response, attempt, cap=60):
+    """
+    Computes how long to wait before retrying a throttled request.
+
+    The `Retry-After` header is honored when it contains a number of seconds,
+    otherwise an exponential backoff with jitter is used. Either way the delay
+    never exceeds `cap`.
+
+    Args:
+        response (requests.Response): The throttled (HTTP 429) response.
+        attempt (int): Number of the failed attempt, starting at 1.
+        cap (float, optional): Maximum delay in seconds. Default is 60.
+
+    Returns:
+        float: Seconds to wait before the next attempt.
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after is not None:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            logger.warning("Unexpected Retry-After header: %s", retry_after)
+    return min(cap, 2 ** attempt) + random.uniform(0, 1)
+
+def get_backoff_delay(attempt, base=1.0, cap=30.0):
+    """
+    Computes a truncated exponential backoff with full jitter.
+
+    Args:
+        attempt (int): Number of the failed attempt, starting at 1.
+        base (float, optional): Delay bound of the first retry in seconds. Default is 1.
+        cap (float, optional): Maximum delay bound in seconds. Default is 30.
+
+    Returns:
+        float: Seconds to wait, drawn uniformly from [0, min(cap, base * 2**(attempt - 1))].
+    """
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
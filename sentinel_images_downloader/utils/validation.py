@@ -0,0 +1,98 @@
+import struct
+import logging
+
+logger = logging.getLogger(__name__)
+
+# JPEG 2000 signature box, the first 12 bytes of every JP2 file
+JP2_SIGNATURE = b"\x00\x00\x00\x0cjP  \r\n\x87\n"
+# End of codestream marker, the last 2 bytes of the contiguous codestream box
+JP2_EOC_MARKER = b"\xff\xd9"
+
+TIFF_SIGNATURES = (b"II*\x00", b"MM\x00*", b"II+\x00", b"MM\x00+")
+
+def check_jp2(file_path):
+    """
+    Checks that a JPEG 2000 (JP2) file is complete without decoding it.
+
+    The signature box is checked, then the top-level box headers are walked up
+    to the end of the file. The contiguous codestream box (`jp2c`) must end
+    with the EOC marker, and box lengths that do not add up to the file size
+    reveal a truncated download. Only a few bytes per box are read.
+
+    Args:
+        file_path (pathlib.Path): The path to the JP2 file.
+
+    Raises:
+        ValueError: If the file is not a JP2 file or is truncated.
+
+    Example:
+        >>> check_jp2(Path("T19HCC_20180101T143751_B02_10m.jp2"))
+    """
+    size = file_path.stat().st_size
+    with file_path.open("rb") as file:
+        if file.read(len(JP2_SIGNATURE)) != JP2_SIGNATURE:
+            raise ValueError(f"Invalid JP2 file {file_path}: missing JP2 signature box")
+
+        has_codestream = False
+        offset = len(JP2_SIGNATURE)
+        while offset < size:
+            file.seek(offset)
+            header = file.read(8)
+            if len(header) < 8:
+                break
+            length, box_type = struct.unpack(">I4s", header)
+            if length == 1:
+                extended_length = file.read(8)
+                if len(extended_length) < 8:
+                    break
+                length = struct.unpack(">Q", extended_length)[0]
+            elif length == 0:
+                length = size - offset
+            if length < 8 or offset + length > size:
+                break
+
+            if box_type == b"jp2c":
+                file.seek(offset + length - len(JP2_EOC_MARKER))
+                if file.read(len(JP2_EOC_MARKER)) != JP2_EOC_MARKER:
+                    raise ValueError(f"Invalid JP2 file {file_path}: missing end of codestream marker")
+                has_codestream = True
+            offset += length
+
+    if has_codestream and offset == size:
+        return
+    raise ValueError(f"Invalid JP2 file {file_path}: truncated or missing codestream")
+
+def check_tiff(file_path):
+    """
+    Checks that a file starts with a TIFF (or BigTIFF) header without decoding it.
+
+    Args:
+        file_path (pathlib.Path): The path to the TIFF file.
+
+    Raises:
+        ValueError: If the file does not have a TIFF header.
+    """
+    with file_path.open("rb") as file:
+        if file.read(4) not in TIFF_SIGNATURES:
+            raise ValueError(f"Invalid TIFF file {file_path}: missing TIFF header")
+
+def check_raster(file_path):
+    """
+    Opens a raster with rasterio to make sure GDAL can read it.
+
+    This is much slower than the header checks, and rasterio is only imported
+    when a deep validation is requested.
+
+    Args:
+        file_path (pathlib.Path): The path to the raster file.
+
+    Raises:
+        ValueError: If the file cannot be opened.
+    """
+    import rasterio
+
+    try:
+        with rasterio.open(file_path) as src:
+            src.meta
+    except Exception as e:
+        raise ValueError(f"Unreadable raster {file_path}: {e}") from e
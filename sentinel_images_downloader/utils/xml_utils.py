@@ -1,10 +1,26 @@
-from xml.etree import cElementTree as ElementTree
+from functools import lru_cache
+from pathlib import Path
 import logging
 
+try:
+    from lxml.etree import iterparse
+    # Only report the elements `iter_entries` looks at, ignore blank text and
+    # never expand entities
+    ITERPARSE_OPTIONS = {
+        "tag": ("{*}dataObjectSection", "{*}byteStream"),
+        "remove_blank_text": True,
+        "resolve_entities": False,
+    }
+except ImportError:
+    from xml.etree.ElementTree import iterparse
+    ITERPARSE_OPTIONS = {}
+
 logger = logging.getLogger(__name__)
 
 ## --------------------------------------------------------------------------------------------
 # https://stackoverflow.com/a/78101353
+# Generic XML to dict converters, kept for backwards compatibility. Manifests
+# are streamed with `iter_entries` instead.
 
 class XmlListConfig(list):
     """
@@ -74,83 +90,108 @@ class XmlDictConfig(dict):
 
 ## --------------------------------------------------------------------------------------------
 
-def parse_manifest(file_path):
+def iter_entries(file_path):
     """
-    Parses an XML manifest file and converts it into a Python dictionary.
+    Streams the data objects listed in a manifest file.
+
+    The XML tree is never materialized: each `byteStream` inside
+    `dataObjectSection` is read when its closing tag is parsed and then
+    cleared. `lxml` is used when it is installed, otherwise the standard
+    library parser. With `lxml`, only the `dataObjectSection` and `byteStream`
+    events reach Python, the rest of the manifest is skipped in C.
 
     Args:
-        file_path (pathlib.Path): The path to the XML file to be parsed.
+        file_path (pathlib.Path): The path to the manifest file.
 
-    Returns:
-        dict: A dictionary representation of the XML structure.
+    Yields:
+        dict: For each file, its "href" (path relative to the product root),
+        its "size" in bytes and its "md5" checksum in lowercase hexadecimal
+        (None when the manifest does not provide them).
 
     Example:
-        If the XML file contains:
-        <manifest>
-            <dataObjectSection>
-                <dataObject>
-                    <byteStream>
-                        <fileLocation>
-                            <href>./path/to/file</href>
-                        </fileLocation>
-                    </byteStream>
-                </dataObject>
-            </dataObjectSection>
-        </manifest>
-
-        The function will return a dictionary like:
-        {
-            'dataObjectSection': {
-                'dataObject': [{
-                    'byteStream': {
-                        'fileLocation': {
-                            'href': './path/to/file'
-                        }
-                    }
-                }]
-            }
-        }
+        >>> list(iter_entries(Path("manifest.safe")))
+        [{'href': 'path/to/file1', 'size': 1024, 'md5': '9e107d9d372bb6826bd81d3542a419d6'}, ...]
+    """
+    in_data_section = False
+    in_byte_stream = False
+    for event, element in iterparse(str(file_path), events=("start", "end"), **ITERPARSE_OPTIONS):
+        tag = element.tag.rsplit("}", 1)[-1]
+        if tag == "dataObjectSection":
+            in_data_section = event == "start"
+        elif tag == "byteStream":
+            in_byte_stream = event == "start"
+        if event != "end" or in_byte_stream:
+            continue
+
+        if in_data_section and tag == "byteStream":
+            href = md5 = None
+            for child in element:
+                child_tag = child.tag.rsplit("}", 1)[-1]
+                if child_tag == "fileLocation":
+                    href = child.get("href")
+                elif child_tag == "checksum" and (child.get("checksumName") or "").upper() == "MD5":
+                    md5 = (child.text or "").strip().lower() or None
+            if href is not None:
+                size = element.get("size")
+                yield {
+                    "href": href.split("./")[-1],
+                    "size": int(size) if size else None,
+                    "md5": md5,
+                }
+        element.clear()
+
+def iter_files(file_path):
+    """
+    Streams the file paths listed in the data objects of a manifest file.
+
+    Args:
+        file_path (pathlib.Path): The path to the manifest file.
+
+    Yields:
+        str: The path of each file, relative to the product root.
+
+    Example:
+        >>> list(iter_files(Path("manifest.safe")))
+        ['path/to/file1', 'path/to/file2']
     """
-    logger.info(f"Parsing {file_path}...")
-    tree = ElementTree.parse(file_path)
-    root = tree.getroot()
-    xmldict = XmlDictConfig(root)
-    return xmldict
+    for entry in iter_entries(file_path):
+        yield entry["href"]
 
-def get_files(xmldict):
+def get_manifest_entries(file_path):
     """
-    Extracts a list of file paths from a parsed XML dictionary.
+    Returns the data objects listed in a manifest file.
+
+    Results are memoized per file path and modification time.
 
     Args:
-        xmldict (dict): The parsed XML data in dictionary form.
+        file_path (pathlib.Path): The path to the manifest file.
 
     Returns:
-        list: A list of file paths extracted from the XML.
+        list[dict]: The "href", "size" and "md5" of each file, as yielded by `iter_entries`.
+    """
+    file_path = Path(file_path)
+    return [dict(entry) for entry in _get_manifest_entries(file_path, file_path.stat().st_mtime_ns)]
 
-    Example:
-        Given the parsed XML structure:
-        {
-            'dataObjectSection': {
-                'dataObject': [{
-                    'byteStream': {
-                        'fileLocation': {
-                            'href': './path/to/file1'
-                        }
-                    }
-                }, {
-                    'byteStream': {
-                        'fileLocation': {
-                            'href': './path/to/file2'
-                        }
-                    }
-                }]
-            }
-        }
+@lru_cache(maxsize=128)
+def _get_manifest_entries(file_path, mtime_ns):
+    """Cached implementation of `get_manifest_entries`, keyed on the modification time."""
+    logger.info("Parsing %s...", file_path)
+    return tuple(iter_entries(file_path))
+
+def get_files(file_path):
+    """
+    Returns the file paths listed in a manifest file.
 
-        The function will return:
+    Results are memoized per file path and modification time.
+
+    Args:
+        file_path (pathlib.Path): The path to the manifest file.
+
+    Returns:
+        list[str]: The path of each file, relative to the product root.
+
+    Example:
+        >>> get_files(Path("manifest.safe"))
         ['path/to/file1', 'path/to/file2']
     """
-    return [
-        file["byteStream"]["fileLocation"]["href"].split("./")[-1]
-        for file in xmldict["dataObjectSection"]["dataObject"]
-    ]
\ No newline at end of file
+    return [entry["href"] for entry in get_manifest_entries(file_path)]
@@ -0,0 +1,105 @@
+from sentinel_images_downloader.config.path import PROJECT_DIR
+from sentinel_images_downloader.downloader import base_downloader
+from sentinel_images_downloader.downloader.s2_downloader import Sentinel2
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import pytest
+
+MANIFEST = """<?xml version="1.0" encoding="UTF-8"?>
+<xfdu:XFDU xmlns:xfdu="urn:ccsds:schema:xfdu:1">
+  <metadataSection>
+    <metadataObject ID="metadata">
+      <byteStream mimeType="text/xml" size="12">
+        <fileLocation locatorType="URL" href="./ignored.xml"/>
+      </byteStream>
+    </metadataObject>
+  </metadataSection>
+  <dataObjectSection>
+    <dataObject ID="B02">
+      <byteStream mimeType="application/octet-stream" size="1024">
+        <fileLocation locatorType="URL" href="./GRANULE/L2A_T19HCC/IMG_DATA/R10m/T19HCC_20180101T143751_B02_10m.jp2"/>
+        <checksum checksumName="MD5">9E107D9D372BB6826BD81D3542A419D6</checksum>
+      </byteStream>
+    </dataObject>
+    <dataObject ID="MTD">
+      <byteStream mimeType="text/xml">
+        <fileLocation locatorType="URL" href="./MTD_MSIL2A.xml"/>
+      </byteStream>
+    </dataObject>
+  </dataObjectSection>
+</xfdu:XFDU>
+"""
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    path = tmp_path / "manifest.safe"
+    path.write_text(MANIFEST)
+    return path
+
+@pytest.fixture
+def s2_downloader(tmp_path):
+    return Sentinel2(
+        username="user",
+        password="password",
+        tile_ids=["T19HCC"],
+        product_level="L2A",
+        relative_orbits_path=str(PROJECT_DIR / "data" / "s2_relative_orbits.json"),
+        initial_date="2018-01-01",
+        last_date="2018-03-31",
+        band_selection=["B02_10m", "B8A_20m", "SCL"],
+        output_dir=tmp_path / "output",
+        max_retries=3,
+    )
+
+@pytest.fixture
+def catalog_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "catalog_cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(base_downloader, "CATALOG_CACHE_DIR", cache_dir)
+    return cache_dir
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Answers every GET or POST with the (status, headers, body) returned by `server.respond`.
+
+    The body of a POST is available to `server.respond` as `handler.body`.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._answer()
+
+    def do_GET(self):
+        self.body = b""
+        self._answer()
+
+    def _answer(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        status, headers, body = self.server.respond(self)
+        self.send_response(status)
+        headers = {"Content-Length": str(len(body)), **headers}
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def http_server():
+    """
+    Local HTTP server whose answers are set by assigning `respond`, a callable
+    taking the request handler and returning (status, headers, body).
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.requests = []
+    server.respond = lambda handler: (404, {}, b"")
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,174 @@
+from sentinel_images_downloader.utils import auth
+from sentinel_images_downloader.utils.auth import AuthSession, BearerAuth, TokenProvider, get_token_expiry
+from urllib.parse import parse_qs
+import base64
+import stat
+import json
+import time
+import pytest
+import requests
+
+def make_jwt(exp):
+    """Returns an unsigned JWT whose payload holds the `exp` claim."""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+    return f"{encode({'alg': 'none'})}.{encode({'exp': exp})}.signature"
+
+@pytest.fixture
+def keycloak(http_server, monkeypatch):
+    """
+    Fake Keycloak token endpoint on `http_server`.
+
+    Each token request is recorded as a dict in `keycloak.grants` and answered
+    with a new access token valid for an hour. Refresh grants are rejected
+    while `keycloak.reject_refresh` is set.
+    """
+    http_server.grants = []
+    http_server.reject_refresh = False
+
+    def respond(handler):
+        grant = {key: values[0] for key, values in parse_qs(handler.body.decode()).items()}
+        http_server.grants.append(grant)
+        if http_server.reject_refresh and grant["grant_type"] == "refresh_token":
+            return 400, {}, b'{"error": "invalid_grant"}'
+        token_data = {
+            "access_token": make_jwt(time.time() + 3600) + str(len(http_server.grants)),
+            "expires_in": 3600,
+            "refresh_token": f"refresh-{len(http_server.grants)}",
+            "refresh_expires_in": 7200,
+        }
+        return 200, {"Content-Type": "application/json"}, json.dumps(token_data).encode()
+
+    http_server.respond = respond
+    monkeypatch.setattr(auth, "LOGIN_URL", f"{http_server.url}/token")
+    return http_server
+
+class StaticTokenProvider:
+    """Provider handing out a fixed token."""
+    def __init__(self, token="token"):
+        self.token = token
+
+    def get(self):
+        return self.token
+
+    def invalidate(self, token):
+        pass
+
+def _redirect(session, location):
+    """Returns the redirected request built by `session` for a redirect to `location`."""
+    original = requests.Request(
+        "GET", "https://download.dataspace.copernicus.eu/odata/v1/Products(1)/$value",
+        headers={"Authorization": "Bearer token"},
+    ).prepare()
+    response = requests.Response()
+    response.request = original
+    redirected = original.copy()
+    redirected.prepare_url(location, None)
+    session.rebuild_auth(redirected, response)
+    return redirected
+
+@pytest.mark.parametrize("location, keeps_token", [
+    ("https://zipper.dataspace.copernicus.eu/odata/v1/Products(1)/$value", True),
+    ("https://dataspace.copernicus.eu/file", True),
+    ("https://example.com/file", False),
+    ("https://dataspace.copernicus.eu.example.com/file", False),
+    ("http://zipper.dataspace.copernicus.eu/odata/v1/Products(1)/$value", False),
+])
+def test_auth_session_keeps_the_token_on_trusted_https_redirects(location, keeps_token):
+    with AuthSession() as session:
+        session.auth = BearerAuth(StaticTokenProvider())
+        redirected = _redirect(session, location)
+    assert ("Authorization" in redirected.headers) == keeps_token
+
+def test_get_token_expiry_reads_the_exp_claim():
+    assert get_token_expiry(make_jwt(1700000000)) == 1700000000
+
+@pytest.mark.parametrize("token", ["not-a-jwt", "a.b.c", make_jwt("soon")])
+def test_get_token_expiry_returns_zero_for_unreadable_tokens(token):
+    assert get_token_expiry(token) == 0.0
+
+def test_token_provider_reuses_the_token_until_it_expires(keycloak):
+    provider = TokenProvider("user", "password")
+    token = provider.get()
+    assert provider.get() == token
+    assert len(keycloak.grants) == 1
+    assert keycloak.grants[0]["grant_type"] == "password"
+    assert provider._expiry == pytest.approx(time.time() + 3600, abs=5)
+
+    provider._expiry = time.time() + provider.margin / 2
+    assert provider.get() != token
+    assert len(keycloak.grants) == 2
+
+class RotatingTokenProvider:
+    """Provider handing out "token-1", then a new token after each invalidation."""
+    def __init__(self):
+        self.generation = 1
+        self.invalidated = []
+
+    def get(self):
+        return f"token-{self.generation}"
+
+    def invalidate(self, token):
+        self.invalidated.append(token)
+        self.generation += 1
+
+def test_bearer_auth_renews_the_token_and_retries_once_on_401(http_server):
+    def respond(handler):
+        if handler.headers["Authorization"] == "Bearer token-1":
+            return 401, {}, b""
+        return 200, {}, b"ok"
+    http_server.respond = respond
+
+    provider = RotatingTokenProvider()
+    with requests.Session() as session:
+        session.auth = BearerAuth(provider)
+        response = session.get(f"{http_server.url}/file")
+    assert response.status_code == 200
+    assert response.content == b"ok"
+    assert [response.status_code for response in response.history] == [401]
+    assert provider.invalidated == ["token-1"]
+    assert [headers["Authorization"] for _, headers in http_server.requests] == ["Bearer token-1", "Bearer token-2"]
+
+def test_bearer_auth_gives_up_after_one_retry(http_server):
+    http_server.respond = lambda handler: (401, {}, b"")
+    provider = RotatingTokenProvider()
+    with requests.Session() as session:
+        session.auth = BearerAuth(provider)
+        response = session.get(f"{http_server.url}/file")
+    assert response.status_code == 401
+    assert len(http_server.requests) == 2
+
+def test_token_provider_renews_expired_tokens_with_the_refresh_token(keycloak):
+    provider = TokenProvider("user", "password")
+    provider.get()
+    provider._expiry = 0.0
+    provider.get()
+    assert [grant["grant_type"] for grant in keycloak.grants] == ["password", "refresh_token"]
+    assert keycloak.grants[1]["refresh_token"] == "refresh-1"
+
+def test_token_provider_logs_in_again_when_the_refresh_fails(keycloak):
+    provider = TokenProvider("user", "password")
+    provider.get()
+    provider._expiry = 0.0
+    keycloak.reject_refresh = True
+    provider.get()
+    assert [grant["grant_type"] for grant in keycloak.grants] == ["password", "refresh_token", "password"]
+
+def test_token_provider_caches_tokens_for_the_owner_only(keycloak, tmp_path):
+    cache_path = tmp_path / "cdse" / "token.json"
+    token = TokenProvider("user", "password", cache_path=cache_path).get()
+
+    assert stat.S_IMODE(cache_path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(cache_path.parent.stat().st_mode) == 0o700
+    cache = json.loads(cache_path.read_text())
+    assert cache["username"] == "user"
+    assert cache["access_token"] == token
+
+    assert TokenProvider("user", "password", cache_path=cache_path).get() == token
+    assert len(keycloak.grants) == 1
+
+def test_token_provider_ignores_the_cache_of_another_user(keycloak, tmp_path):
+    cache_path = tmp_path / "token.json"
+    token = TokenProvider("user", "password", cache_path=cache_path).get()
+    assert TokenProvider("other", "password", cache_path=cache_path).get() != token
+    assert len(keycloak.grants) == 2
@@ -0,0 +1,131 @@
+from sentinel_images_downloader.downloader import base_downloader
+import hashlib
+import re
+import pytest
+import requests
+
+def _answers(*answers):
+    """Returns a `respond` callable serving the given answers in order, repeating the last one."""
+    answers = list(answers)
+
+    def respond(handler):
+        return answers.pop(0) if len(answers) > 1 else answers[0]
+    return respond
+
+def _authenticated_session(downloader):
+    """Returns the session of `init_session`, with its HTTPS adapter also used for plain HTTP."""
+    downloader._token_provider.get = lambda: "token"
+    session = downloader.init_session()
+    session.mount("http://", session.get_adapter("https://"))
+    return session
+
+def test_get_retrying_retries_throttled_requests(s2_downloader, http_server, monkeypatch):
+    monkeypatch.setattr(base_downloader, "get_retry_delay", lambda response, attempt: 0)
+    http_server.respond = _answers((429, {}, b""), (200, {}, b"ok"))
+    with requests.Session() as session:
+        response = s2_downloader._get_retrying(session, f"{http_server.url}/file")
+    assert response.status_code == 200
+    assert response.content == b"ok"
+    assert len(http_server.requests) == 2
+    assert s2_downloader._rate_limited_until > 0
+
+def test_session_leaves_throttled_responses_to_get(s2_downloader, http_server, monkeypatch):
+    monkeypatch.setattr(base_downloader, "get_retry_delay", lambda response, attempt: 0)
+    http_server.respond = _answers((429, {}, b""))
+    with _authenticated_session(s2_downloader) as session:
+        response = s2_downloader._get(session, f"{http_server.url}/file")
+    assert response.status_code == 429
+    assert len(http_server.requests) == 1
+
+def test_catalog_page_is_retried_after_throttling(s2_downloader, http_server, catalog_cache_dir, monkeypatch):
+    monkeypatch.setattr(base_downloader, "get_retry_delay", lambda response, attempt: 0)
+    http_server.respond = _answers((429, {}, b""), (200, {}, b'{"value": [{"Id": "1"}]}'))
+    page = s2_downloader.get_catalog_page(f"{http_server.url}/Products?$filter=x")
+    assert page == {"value": [{"Id": "1"}]}
+    assert len(http_server.requests) == 2
+    assert len(list(catalog_cache_dir.iterdir())) == 1
+
+def test_large_retry_after_is_capped(s2_downloader, http_server, tmp_path, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(base_downloader.time, "sleep", sleeps.append)
+    http_server.respond = _answers((429, {"Retry-After": "3600"}, b""))
+    with _authenticated_session(s2_downloader) as session:
+        with pytest.raises(requests.exceptions.HTTPError):
+            s2_downloader.fetch_file(session, http_server.url, tmp_path, "B02.jp2")
+    assert sleeps and max(sleeps) <= 60
+
+def test_throttled_files_are_retried_once_per_attempt_outside_the_slot(
+    s2_downloader, http_server, tmp_path, monkeypatch,
+):
+    slots = s2_downloader._download_slots
+    free_slots = []
+    monkeypatch.setattr(base_downloader.time, "sleep", lambda delay: free_slots.append(slots._value))
+    http_server.respond = _answers((429, {"Retry-After": "1"}, b""))
+    with requests.Session() as session:
+        with pytest.raises(requests.exceptions.HTTPError):
+            s2_downloader.fetch_file(session, http_server.url, tmp_path, "B02.jp2")
+    assert len(http_server.requests) <= s2_downloader.max_retries
+    assert free_slots == [s2_downloader.max_concurrent_downloads] * (s2_downloader.max_retries - 1)
+
+def test_catalog_page_is_retried_after_server_errors(s2_downloader, http_server, catalog_cache_dir):
+    session = s2_downloader._catalog_session
+    session.mount("http://", session.get_adapter(s2_downloader.data_url))
+    http_server.respond = _answers((503, {}, b""), (200, {}, b'{"value": []}'))
+    assert s2_downloader.get_catalog_page(f"{http_server.url}/Products?$filter=y") == {"value": []}
+    assert len(http_server.requests) == 2
+
+CONTENT = bytes(range(256)) * 64
+
+def _serve_ranges(content, corrupt=None):
+    """
+    Returns a `respond` callable serving `content`, honoring `Range` headers.
+
+    `corrupt`, if given, maps the (start, end, body) of each range to the
+    (Content-Range, body) actually sent.
+    """
+    def respond(handler):
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", handler.headers.get("Range", ""))
+        if match is None:
+            return 200, {"Accept-Ranges": "bytes"}, content
+        start, end = int(match.group(1)), int(match.group(2))
+        content_range, body = f"bytes {start}-{end}/{len(content)}", content[start:end + 1]
+        if corrupt is not None:
+            content_range, body = corrupt(start, end, body)
+        return 206, {"Content-Range": content_range}, body
+    return respond
+
+@pytest.fixture
+def ranged(monkeypatch):
+    monkeypatch.setattr(base_downloader, "RANGED_DOWNLOAD_THRESHOLD", 1024)
+
+def test_ranged_download_assembles_the_file(s2_downloader, http_server, tmp_path, ranged):
+    http_server.respond = _serve_ranges(CONTENT)
+    with requests.Session() as session:
+        s2_downloader.fetch_file(
+            session, http_server.url, tmp_path, "data.bin", len(CONTENT), hashlib.md5(CONTENT).hexdigest(),
+        )
+    assert (tmp_path / "data.bin").read_bytes() == CONTENT
+    assert any("Range" in headers for _, headers in http_server.requests)
+
+@pytest.mark.parametrize("corrupt", [
+    lambda start, end, body: (f"bytes {start}-{end}/{len(CONTENT)}", body[:-10]),
+    lambda start, end, body: (f"bytes {start + 10}-{end}/{len(CONTENT)}", body[10:]),
+    lambda start, end, body: (f"bytes {start}-{end}/{len(CONTENT)}", bytes(len(body))),
+])
+def test_ranged_download_rejects_corrupt_ranges(s2_downloader, http_server, tmp_path, corrupt):
+    http_server.respond = _serve_ranges(CONTENT, corrupt)
+    file_path = tmp_path / "data.bin"
+    with requests.Session() as session:
+        with pytest.raises(ValueError):
+            s2_downloader._ranged_download(
+                session, http_server.url, file_path, len(CONTENT), hashlib.md5(CONTENT).hexdigest(),
+            )
+    assert not file_path.exists()
+    assert not file_path.with_name("data.bin.part").exists()
+
+def test_check_size_uses_the_bytes_received(tmp_path):
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(bytes(100))
+    base_downloader.SentinelDownloader.check_size(file_path, 100)
+    with pytest.raises(ValueError):
+        base_downloader.SentinelDownloader.check_size(file_path, 100, size=90)
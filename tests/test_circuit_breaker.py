@@ -0,0 +1,88 @@
+from sentinel_images_downloader.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from types import SimpleNamespace
+import threading
+import time
+import pytest
+
+def http_error(status_code):
+    error = RuntimeError(f"HTTP {status_code}")
+    error.response = SimpleNamespace(status_code=status_code)
+    return error
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    for _ in range(2):
+        breaker.record_failure(http_error(503))
+    breaker.check()
+    breaker.record_failure(http_error(503))
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    for _ in range(2):
+        breaker.record_failure(http_error(503))
+    breaker.record_success()
+    for _ in range(2):
+        breaker.record_failure(http_error(503))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_refused_credentials_open_the_breaker_right_away():
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    breaker.record_failure(http_error(401))
+    assert breaker.is_open
+
+def test_breaker_half_opens_after_the_cooldown_and_closes_on_success():
+    breaker = CircuitBreaker(threshold=1, cooldown=0.05)
+    breaker.record_failure(http_error(503))
+    assert breaker.is_open
+    time.sleep(0.06)
+    assert not breaker.is_open
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.check()
+    waiter = threading.Thread(target=breaker.check)
+    waiter.start()
+    waiter.join(timeout=0.05)
+    assert waiter.is_alive()
+
+    breaker.record_success()
+    waiter.join(timeout=1)
+    assert not waiter.is_alive()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_failed_trial_opens_the_breaker_again():
+    breaker = CircuitBreaker(threshold=1, cooldown=0.05)
+    breaker.record_failure(http_error(503))
+    time.sleep(0.06)
+    breaker.check()
+    breaker.record_failure(http_error(503))
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+def test_wait_sleeps_for_the_rest_of_the_cooldown():
+    breaker = CircuitBreaker(threshold=1, cooldown=0.1)
+    breaker.wait()
+    breaker.record_failure(http_error(503))
+    start = time.monotonic()
+    breaker.wait()
+    assert time.monotonic() - start >= 0.09
+    assert not breaker.is_open
+
+def test_download_tile_range_skips_products_once_the_breaker_opens(s2_downloader, monkeypatch):
+    products = [{"Id": str(i), "Name": f"product-{i}"} for i in range(20)]
+    attempted = []
+
+    def download_product(session, SAFE_product):
+        attempted.append(SAFE_product["Name"])
+        raise http_error(503)
+
+    s2_downloader.max_parallel_products = 1
+    monkeypatch.setattr(s2_downloader, "_iter_products", lambda tile_id, date_ranges: iter(products))
+    monkeypatch.setattr(s2_downloader, "download_product", download_product)
+    with pytest.raises(RuntimeError):
+        s2_downloader.download_tile_range(None, "T19HCC", s2_downloader.date_ranges)
+    assert len(attempted) == s2_downloader._breaker.threshold
+    assert s2_downloader._breaker.is_open
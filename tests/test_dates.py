@@ -0,0 +1,28 @@
+from sentinel_images_downloader.utils.dates import process_dates
+import pytest
+
+def test_process_dates_splits_by_month():
+    assert process_dates("2023-01-15", "2023-03-10") == [
+        ("2023-01-15T00:00:00.000Z", "2023-01-31T23:59:59.999Z"),
+        ("2023-02-01T00:00:00.000Z", "2023-02-28T23:59:59.999Z"),
+        ("2023-03-01T00:00:00.000Z", "2023-03-10T23:59:59.999Z"),
+    ]
+
+def test_process_dates_handles_leap_years_and_year_ends():
+    ranges = process_dates("2020-02-01", "2021-01-31")
+    assert len(ranges) == 12
+    assert ranges[0] == ("2020-02-01T00:00:00.000Z", "2020-02-29T23:59:59.999Z")
+    assert ranges[10] == ("2020-12-01T00:00:00.000Z", "2020-12-31T23:59:59.999Z")
+    assert ranges[11] == ("2021-01-01T00:00:00.000Z", "2021-01-31T23:59:59.999Z")
+
+def test_process_dates_single_day():
+    assert process_dates("2018-01-01", "2018-01-01") == [
+        ("2018-01-01T00:00:00.000Z", "2018-01-01T23:59:59.999Z"),
+    ]
+
+def test_process_dates_swaps_reversed_dates():
+    assert process_dates("2018-02-10", "2018-01-20") == process_dates("2018-01-20", "2018-02-10")
+
+def test_process_dates_rejects_invalid_format():
+    with pytest.raises(ValueError):
+        process_dates("01/01/2018", "2018-02-01")
@@ -0,0 +1,54 @@
+from sentinel_images_downloader.utils.ratelimit import (
+    RateLimiter, SlidingWindowLimiter, TokenBucket, get_backoff_delay, get_retry_delay
+)
+from types import SimpleNamespace
+import time
+
+def test_token_bucket_allows_a_burst_then_paces():
+    bucket = TokenBucket(rate=20)
+    start = time.monotonic()
+    for _ in range(20):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.05
+    for _ in range(2):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.08
+
+def test_token_bucket_serves_rates_below_one_per_second():
+    bucket = TokenBucket(rate=0.5)
+    assert bucket.capacity == 1
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start < 0.05
+
+def test_sliding_window_never_exceeds_its_limit():
+    limiter = SlidingWindowLimiter(limit=5, period=0.2)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.05
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.2
+
+def test_rate_limiter_enforces_the_hourly_quota_from_the_start():
+    limiter = RateLimiter(requests_per_second=1000, requests_per_hour=100)
+    hourly = limiter.buckets[1]
+    assert isinstance(hourly, SlidingWindowLimiter)
+    for _ in range(100):
+        limiter.acquire()
+    assert len(hourly._timestamps) == hourly.limit == 100
+
+def test_get_retry_delay_honors_retry_after():
+    response = SimpleNamespace(headers={"Retry-After": "5"})
+    assert get_retry_delay(response, attempt=1) == 5
+
+def test_get_retry_delay_is_capped():
+    response = SimpleNamespace(headers={"Retry-After": "3600"})
+    assert get_retry_delay(response, attempt=1) == 60
+
+def test_get_retry_delay_falls_back_to_backoff():
+    response = SimpleNamespace(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert 2 <= get_retry_delay(response, attempt=1) <= 3
+
+def test_get_backoff_delay_is_bounded():
+    assert all(0 <= get_backoff_delay(attempt) <= 30 for attempt in range(1, 20))
@@ -0,0 +1,31 @@
+FILES = [
+    "GRANULE/L2A_T19HCC/IMG_DATA/R10m/T19HCC_20180101T143751_B02_10m.jp2",
+    "GRANULE/L2A_T19HCC/IMG_DATA/R20m/T19HCC_20180101T143751_B02_20m.jp2",
+    "GRANULE/L2A_T19HCC/IMG_DATA/R20m/T19HCC_20180101T143751_B8A_20m.jp2",
+    "GRANULE/L2A_T19HCC/IMG_DATA/R20m/T19HCC_20180101T143751_SCL_20m.jp2",
+    "GRANULE/L2A_T19HCC/IMG_DATA/R60m/T19HCC_20180101T143751_SCL_60m.jp2",
+    "GRANULE/L2A_T19HCC/QI_DATA/T19HCC_20180101T143751_B02_10m.jp2",
+    "GRANULE/L1C_T19HCC/IMG_DATA/T19HCC_20180101T143751_B8A.jp2",
+    "MTD_MSIL2A.xml",
+]
+
+def test_filter_images_matches_bands(s2_downloader):
+    assert s2_downloader.filter_images(FILES) == [
+        "GRANULE/L2A_T19HCC/IMG_DATA/R10m/T19HCC_20180101T143751_B02_10m.jp2",
+        "GRANULE/L2A_T19HCC/IMG_DATA/R20m/T19HCC_20180101T143751_B8A_20m.jp2",
+        "GRANULE/L2A_T19HCC/IMG_DATA/R20m/T19HCC_20180101T143751_SCL_20m.jp2",
+        "GRANULE/L2A_T19HCC/IMG_DATA/R60m/T19HCC_20180101T143751_SCL_60m.jp2",
+    ]
+
+def test_filter_images_matches_bands_without_resolution(s2_downloader):
+    s2_downloader._band_set = {"B8A"}
+    assert s2_downloader.filter_images(FILES) == [
+        "GRANULE/L2A_T19HCC/IMG_DATA/R20m/T19HCC_20180101T143751_B8A_20m.jp2",
+        "GRANULE/L1C_T19HCC/IMG_DATA/T19HCC_20180101T143751_B8A.jp2",
+    ]
+
+def test_get_query_combines_date_ranges(s2_downloader):
+    query = s2_downloader.get_query("T19HCC", s2_downloader.date_ranges)
+    assert "contains(Name, 'T19HCC')" in query
+    assert "contains(Name, 'R096')" in query
+    assert query.count("ContentDate/Start ge") == 3
@@ -0,0 +1,45 @@
+from sentinel_images_downloader.utils.validation import JP2_SIGNATURE, check_jp2, check_tiff
+import struct
+import pytest
+
+def box(box_type, payload):
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+def xl_box(box_type, payload):
+    return struct.pack(">I4sQ", 1, box_type, 16 + len(payload)) + payload
+
+FTYP = box(b"ftyp", b"jp2 \x00\x00\x00\x00jp2 ")
+CODESTREAM = b"\xff\x4f\xff\x51" + bytes(100) + b"\xff\xd9"
+
+@pytest.fixture
+def write(tmp_path):
+    def write(content, name="image.jp2"):
+        path = tmp_path / name
+        path.write_bytes(content)
+        return path
+    return write
+
+@pytest.mark.parametrize("content", [
+    JP2_SIGNATURE + FTYP + box(b"jp2c", CODESTREAM),
+    JP2_SIGNATURE + FTYP + xl_box(b"jp2c", CODESTREAM),
+    JP2_SIGNATURE + FTYP + box(b"jp2c", CODESTREAM) + box(b"xml ", b"<metadata/>"),
+])
+def test_check_jp2_accepts_complete_files(write, content):
+    check_jp2(write(content))
+
+@pytest.mark.parametrize("content", [
+    b"not a jp2 file",
+    JP2_SIGNATURE + FTYP,
+    (JP2_SIGNATURE + FTYP + box(b"jp2c", CODESTREAM))[:-30],
+    JP2_SIGNATURE + FTYP + box(b"jp2c", CODESTREAM[:-2] + b"\x00\x00"),
+    JP2_SIGNATURE + FTYP + xl_box(b"jp2c", CODESTREAM)[:12],
+    JP2_SIGNATURE + FTYP + struct.pack(">I4sQ", 1, b"jp2c", 1 << 40) + CODESTREAM,
+])
+def test_check_jp2_rejects_truncated_or_corrupt_files(write, content):
+    with pytest.raises(ValueError):
+        check_jp2(write(content))
+
+def test_check_tiff(write):
+    check_tiff(write(b"II*\x00" + bytes(8), "image.tiff"))
+    with pytest.raises(ValueError):
+        check_tiff(write(b"<html>", "image.tiff"))
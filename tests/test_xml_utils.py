@@ -0,0 +1,22 @@
+from sentinel_images_downloader.utils.xml_utils import get_files, get_manifest_entries, iter_entries
+
+def test_iter_entries_reads_data_objects(manifest_path):
+    assert list(iter_entries(manifest_path)) == [
+        {
+            "href": "GRANULE/L2A_T19HCC/IMG_DATA/R10m/T19HCC_20180101T143751_B02_10m.jp2",
+            "size": 1024,
+            "md5": "9e107d9d372bb6826bd81d3542a419d6",
+        },
+        {"href": "MTD_MSIL2A.xml", "size": None, "md5": None},
+    ]
+
+def test_get_files(manifest_path):
+    assert get_files(manifest_path) == [
+        "GRANULE/L2A_T19HCC/IMG_DATA/R10m/T19HCC_20180101T143751_B02_10m.jp2",
+        "MTD_MSIL2A.xml",
+    ]
+
+def test_get_manifest_entries_returns_copies(manifest_path):
+    entries = get_manifest_entries(manifest_path)
+    entries[0]["md5"] = None
+    assert get_manifest_entries(manifest_path)[0]["md5"] == "9e107d9d372bb6826bd81d3542a419d6"